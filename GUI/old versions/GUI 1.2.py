@@ -1,17 +1,36 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import bisect
+import functools
 import json
 import os
 import re
+import sys
 
-# Try to import CoolProp, handle gracefully if missing
-try:
-    import CoolProp.CoolProp as cp
+# Numeric fast-paths, so validation never goes through ValueError on typing
+_NUM_RE = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+_INT_RE = re.compile(r'^[+-]?\d+$')
 
-    COOLPROP_AVAILABLE = True
-except ImportError:
-    COOLPROP_AVAILABLE = False
-    print("Warning: CoolProp not available. Using fallback oxidizer list.")
+
+def _is_float(s):
+    return bool(_NUM_RE.match(s))
+
+
+_ELEMENT_RE = re.compile(r'([A-Z][a-z]?)(\d*)')
+_VALID_FORMULA_RE = re.compile(r'(?:[A-Z][a-z]?\d*)+')
+
+# Shared widget options for form rows and popups
+_LABEL_OPTS = {'font': ('Arial', 11), 'anchor': 'w'}
+_ENTRY_OPTS = {'font': ('Arial', 11), 'width': 30, 'relief': tk.SUNKEN, 'bd': 2,
+               'highlightthickness': 2}
+_POPUP_ENTRY_OPTS = {'font': ('Arial', 11)}
+_ERROR_LABEL_OPTS = {'font': ('Arial', 10), 'fg': 'red'}
+
+# Compact encoder for saved configurations; encode() takes the C fast path, iterencode() does not
+_CONFIG_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# (sorted reactants, lowercased reactants, char -> indices), filled on first load
+_CEA_CACHE = None
 
 
 class HybridRocketGUI:
@@ -36,16 +55,28 @@ class HybridRocketGUI:
         self.text_color = 'white'
         self.button_inactive = '#a0a0a0'
         self.button_active = '#6c6c6c'
+        self.valid_color = '#00aa00'
+        self.invalid_color = 'red'
+        self.button_valid = '#006400'
+        self.button_invalid = '#8b0000'
 
         # Variables for inputs
         self.inputs = {}
         self.dropdowns = {}
         self.current_page = 'configuration'
 
+        # Incremental validation state
+        self._valid_state = {}
+        self._invalid_count = 0
+        self._extras_valid = False
+        self._entry_to_key = {}
+        self._pending_validate = {}
+
         # Variables for multi-fuel selection
         self.selected_fuels = []
         self.fuel_weight_entries = {}
         self.dropdown_frame = None
+        self.dropdown_visible = False
 
         # Load reactant lists
         self.load_reactant_lists()
@@ -62,28 +93,60 @@ class HybridRocketGUI:
         self.style.map("Rounded.TButton",
                        background=[('active', self.button_active), ('!active', self.button_inactive)],
                        foreground=[('active', 'white'), ('!active', 'black')])
+        # Page button of the current page
+        self.style.configure("Active.Rounded.TButton", background=self.button_active)
+        self.style.map("Active.Rounded.TButton",
+                       background=[('active', self.button_active), ('!active', self.button_active)],
+                       foreground=[('active', 'white'), ('!active', 'white')])
+        self._save_btn_bg = None
+        self._active_page_btn = None
 
         # Menu and navigation
         self.create_header()
         self.create_sidebar()
+        self.root.bind("<Button-1>", self.close_dropdown_on_click)
+        # One shared <KeyRelease> handler for every registered input entry
+        self.root.bind_class("ConfigEntry", "<KeyRelease>", self._on_entry_keyrelease)
 
         # Content area
         self.content_frame = tk.Frame(self.root, bg=self.bg_dark)
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=20)
 
+        # Mouse wheel scrolls whichever page canvas is currently shown
+        self._scroll_canvas = None
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
+        # Page frames, built lazily on first visit
+        self._pages = {}
+        self._page_canvases = {}
+
         # Show configuration page
-        self.show_configuration_page()
+        self.change_page('configuration')
 
     def load_reactant_lists(self):
         """Load reactant lists from CEA_reactants.txt and CoolProp"""
-        self.cea_reactants = []
-        try:
-            with open("CEA_reactants.txt", "r", encoding="utf-8") as f:
-                self.cea_reactants = [line.strip() for line in f.readlines() if line.strip()]
-            self.cea_reactants.sort()
-        except FileNotFoundError:
-            print("Warning: CEA_reactants.txt not found. Using empty reactant list.")
-            self.cea_reactants = []
+        # Parsed, sorted and indexed once per process
+        global _CEA_CACHE
+        if _CEA_CACHE is None:
+            try:
+                with open("CEA_reactants.txt", "r", encoding="utf-8") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                print("Warning: CEA_reactants.txt not found. Using empty reactant list.")
+                data = ""
+            reactants = sorted({s for line in data.splitlines() if (s := line.strip())},
+                               key=str.lower)
+
+            # Lowercased names (sorted, since the list is sorted by str.lower) for
+            # bisect prefix lookups, plus a character -> indices index: every name
+            # that contains the search term also contains its first character
+            lowered = [name.lower() for name in reactants]
+            buckets = {}
+            for i, name in enumerate(lowered):
+                for char in set(name):
+                    buckets.setdefault(char, []).append(i)
+            _CEA_CACHE = (reactants, lowered, buckets)
+        self.cea_reactants, self._cea_lower, self._cea_buckets = _CEA_CACHE
 
         self.easy_cea_ox_list = ["Air", "CL2", "CL2(L)", "F2", "F2(L)", "H2O2(L)",
                                  "N2H4(L)", "N2O", "NH4NO3(I)", "O2", "O2(L)",
@@ -92,40 +155,28 @@ class HybridRocketGUI:
         self.easy_cea_fuel_list = ["CH4", "CH4(L)", "H2", "H2(L)", "RP-1", "paraffin",
                                    "Select other options", "Custom with exploded formula"]
 
-        if COOLPROP_AVAILABLE:
-            self.coolprop_fluids = cp.FluidsList()
-        else:
-            self.coolprop_fluids = ["NitrousOxide", "Oxygen", "Nitrogen", "Water",
-                                    "CarbonDioxide", "Methane", "Hydrogen"]
+    @functools.cached_property
+    def coolprop_fluids(self):
+        """CoolProp fluid list, importing CoolProp only on first access"""
+        try:
+            import CoolProp.CoolProp as cp
+        except ImportError:
+            print("Warning: CoolProp not available. Using fallback oxidizer list.")
+            return ["NitrousOxide", "Oxygen", "Nitrogen", "Water",
+                    "CarbonDioxide", "Methane", "Hydrogen"]
+        return cp.FluidsList()
 
     def explode_formula(self, formula):
         """Convert chemical formula to expanded format"""
         formula = formula.replace(" ", "")
-        exploded_formula = ""
-        prec = "1"
-
-        for i, char in enumerate(formula):
-            if char.isupper() and char.isalpha():
-                if prec.isdigit():
-                    exploded_formula = exploded_formula + " " + char
-                else:
-                    exploded_formula = exploded_formula + " " + "1" + " " + char
-                prec = char
-            elif char.islower() and char.isalpha():
-                if prec.isupper() and prec.isalpha():
-                    exploded_formula = exploded_formula + char
-                prec = char
-            elif char.isdigit():
-                if prec.isalpha():
-                    exploded_formula = exploded_formula + " " + char
-                elif prec.isdigit():
-                    exploded_formula = exploded_formula + char
-                prec = char
-            if i == (len(formula) - 1) and char.isalpha():
-                exploded_formula = exploded_formula + " " + "1"
-
-        exploded_formula = exploded_formula.strip()
-        return exploded_formula
+        # findall skips what it cannot read, so reject malformed formulas up front
+        if not _VALID_FORMULA_RE.fullmatch(formula):
+            raise ValueError(f"'{formula}' is not a chemical formula")
+        parts = []
+        for element, count in _ELEMENT_RE.findall(formula):
+            parts.append(element)
+            parts.append(count or "1")
+        return " ".join(parts)
 
     def show_search_popup(self, title, reactant_list, callback, multi_select=False):
         """Show popup window with search functionality"""
@@ -166,14 +217,39 @@ class HybridRocketGUI:
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
 
+        pending_update = None
+
         def update_listbox(*args):
+            nonlocal pending_update
+            pending_update = None
+            if not listbox.winfo_exists():
+                return
+
             search_term = search_var.get().lower()
             listbox.delete(0, tk.END)
-            filtered = [item for item in reactant_list if search_term in item.lower()]
-            for item in filtered:
-                listbox.insert(tk.END, item)
+            if not search_term:
+                filtered = reactant_list
+            elif reactant_list is self.cea_reactants:
+                # Prefix matches first via bisect, then the other substring matches
+                lowered = self._cea_lower
+                start = end = bisect.bisect_left(lowered, search_term)
+                while end < len(lowered) and lowered[end].startswith(search_term):
+                    end += 1
+                filtered = reactant_list[start:end]
+                filtered += [reactant_list[i] for i in self._cea_buckets.get(search_term[0], ())
+                             if (i < start or i >= end) and search_term in lowered[i]]
+            else:
+                filtered = [item for item in reactant_list if search_term in item.lower()]
+            if filtered:
+                listbox.insert(tk.END, *filtered)
+
+        def schedule_update(*args):
+            nonlocal pending_update
+            if pending_update is not None:
+                popup.after_cancel(pending_update)
+            pending_update = popup.after(80, update_listbox)
 
-        search_var.trace('w', update_listbox)
+        search_var.trace('w', schedule_update)
         update_listbox()
 
         def on_select():
@@ -211,34 +287,33 @@ class HybridRocketGUI:
 
         row = tk.Frame(popup, bg=self.bg_medium)
         row.pack(fill=tk.X, padx=20, pady=10)
-        tk.Label(row, text="Chemical Name:", font=('Arial', 11),
-                 bg=self.bg_medium, fg=self.text_color, width=20, anchor='w').pack(side=tk.LEFT)
-        entries['name'] = tk.Entry(row, font=('Arial', 11), width=25)
+        tk.Label(row, text="Chemical Name:",
+                 bg=self.bg_medium, fg=self.text_color, width=20, **_LABEL_OPTS).pack(side=tk.LEFT)
+        entries['name'] = tk.Entry(row, width=25, **_POPUP_ENTRY_OPTS)
         entries['name'].pack(side=tk.LEFT, padx=10)
 
         row = tk.Frame(popup, bg=self.bg_medium)
         row.pack(fill=tk.X, padx=20, pady=10)
-        tk.Label(row, text="Formula (e.g., H2O2):", font=('Arial', 11),
-                 bg=self.bg_medium, fg=self.text_color, width=20, anchor='w').pack(side=tk.LEFT)
-        entries['formula'] = tk.Entry(row, font=('Arial', 11), width=25)
+        tk.Label(row, text="Formula (e.g., H2O2):",
+                 bg=self.bg_medium, fg=self.text_color, width=20, **_LABEL_OPTS).pack(side=tk.LEFT)
+        entries['formula'] = tk.Entry(row, width=25, **_POPUP_ENTRY_OPTS)
         entries['formula'].pack(side=tk.LEFT, padx=10)
 
         row = tk.Frame(popup, bg=self.bg_medium)
         row.pack(fill=tk.X, padx=20, pady=10)
-        tk.Label(row, text="Temperature [K]:", font=('Arial', 11),
-                 bg=self.bg_medium, fg=self.text_color, width=20, anchor='w').pack(side=tk.LEFT)
-        entries['temp'] = tk.Entry(row, font=('Arial', 11), width=25)
+        tk.Label(row, text="Temperature [K]:",
+                 bg=self.bg_medium, fg=self.text_color, width=20, **_LABEL_OPTS).pack(side=tk.LEFT)
+        entries['temp'] = tk.Entry(row, width=25, **_POPUP_ENTRY_OPTS)
         entries['temp'].pack(side=tk.LEFT, padx=10)
 
         row = tk.Frame(popup, bg=self.bg_medium)
         row.pack(fill=tk.X, padx=20, pady=10)
-        tk.Label(row, text="Specific Enthalpy [kJ/mol]:", font=('Arial', 11),
-                 bg=self.bg_medium, fg=self.text_color, width=20, anchor='w').pack(side=tk.LEFT)
-        entries['enthalpy'] = tk.Entry(row, font=('Arial', 11), width=25)
+        tk.Label(row, text="Specific Enthalpy [kJ/mol]:",
+                 bg=self.bg_medium, fg=self.text_color, width=20, **_LABEL_OPTS).pack(side=tk.LEFT)
+        entries['enthalpy'] = tk.Entry(row, width=25, **_POPUP_ENTRY_OPTS)
         entries['enthalpy'].pack(side=tk.LEFT, padx=10)
 
-        error_label = tk.Label(popup, text="", font=('Arial', 10),
-                               bg=self.bg_medium, fg='red')
+        error_label = tk.Label(popup, text="", bg=self.bg_medium, **_ERROR_LABEL_OPTS)
         error_label.pack(pady=10)
 
         def on_confirm():
@@ -307,16 +382,15 @@ class HybridRocketGUI:
             row = tk.Frame(popup, bg=self.bg_medium)
             row.pack(fill=tk.X, padx=40, pady=5)
 
-            tk.Label(row, text=f"{fuel}:", font=('Arial', 11),
-                     bg=self.bg_medium, fg=self.text_color, width=20, anchor='w').pack(side=tk.LEFT)
-            entry = tk.Entry(row, font=('Arial', 11), width=15)
+            tk.Label(row, text=f"{fuel}:",
+                     bg=self.bg_medium, fg=self.text_color, width=20, **_LABEL_OPTS).pack(side=tk.LEFT)
+            entry = tk.Entry(row, width=15, **_POPUP_ENTRY_OPTS)
             entry.pack(side=tk.LEFT, padx=10)
             tk.Label(row, text="%", font=('Arial', 11),
                      bg=self.bg_medium, fg=self.text_color).pack(side=tk.LEFT)
             entries[fuel] = entry
 
-        error_label = tk.Label(popup, text="", font=('Arial', 10),
-                               bg=self.bg_medium, fg='red')
+        error_label = tk.Label(popup, text="", bg=self.bg_medium, **_ERROR_LABEL_OPTS)
         error_label.pack(pady=10)
 
         def on_confirm():
@@ -353,9 +427,9 @@ class HybridRocketGUI:
         confirm_btn.pack(pady=20)
 
     def close_dropdown_on_click(self, event):
-        if hasattr(self, 'dropdown_frame') and self.dropdown_frame:
+        if self.dropdown_visible and event.widget != self.menu_button:
             if event.widget != self.dropdown_frame and event.widget.master != self.dropdown_frame:
-                self.toggle_menu()
+                self.hide_menu()
 
     def create_header(self):
         header = tk.Frame(self.root, bg=self.bg_dark, height=60)
@@ -384,73 +458,116 @@ class HybridRocketGUI:
             btn.pack(fill=tk.X, padx=10, pady=5)
             self.page_buttons[page] = btn
 
-    def toggle_menu(self):
-        if hasattr(self, 'dropdown_frame') and self.dropdown_frame and self.dropdown_frame.winfo_exists():
-            self.dropdown_frame.destroy()
-            self.dropdown_frame = None
-        else:
-            x = self.menu_button.winfo_rootx()
-            y = self.menu_button.winfo_rooty() + self.menu_button.winfo_height()
-            button_width = self.menu_button.winfo_width()
+    def create_dropdown_menu(self):
+        """Build the Save/Save As/Open dropdown once; it is then only shown or hidden"""
+        self.dropdown_frame = tk.Toplevel(self.root)
+        self.dropdown_frame.overrideredirect(True)
+        self.dropdown_frame.configure(bg=self.bg_active)
+        self.dropdown_frame.withdraw()
+
+        save_btn = tk.Button(self.dropdown_frame, text="Save", font=('Arial', 10),
+                             bg=self.bg_light, command=self.save_config,
+                             relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
+        save_btn.pack(fill=tk.X, pady=2, padx=2)
 
-            self.dropdown_frame = tk.Toplevel(self.root)
-            self.dropdown_frame.overrideredirect(True)
-            self.dropdown_frame.configure(bg=self.bg_active)
+        save_as_btn = tk.Button(self.dropdown_frame, text="Save As", font=('Arial', 10),
+                                bg=self.bg_light, command=self.save_config_as,
+                                relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
+        save_as_btn.pack(fill=tk.X, pady=2, padx=2)
 
-            save_btn = tk.Button(self.dropdown_frame, text="Save", font=('Arial', 10),
-                                 bg=self.bg_light, command=self.save_config,
-                                 relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
-            save_btn.pack(fill=tk.X, pady=2, padx=2)
+        open_btn = tk.Button(self.dropdown_frame, text="Open", font=('Arial', 10),
+                             bg=self.bg_light, command=self.open_config,
+                             relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
+        open_btn.pack(fill=tk.X, pady=2, padx=2)
 
-            save_as_btn = tk.Button(self.dropdown_frame, text="Save As", font=('Arial', 10),
-                                    bg=self.bg_light, command=self.save_config_as,
-                                    relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
-            save_as_btn.pack(fill=tk.X, pady=2, padx=2)
+        self.dropdown_frame.bind("<FocusOut>", lambda e: self.hide_menu())
+
+    def toggle_menu(self):
+        if self.dropdown_visible:
+            self.hide_menu()
+            return
 
-            open_btn = tk.Button(self.dropdown_frame, text="Open", font=('Arial', 10),
-                                 bg=self.bg_light, command=self.open_config,
-                                 relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0)
-            open_btn.pack(fill=tk.X, pady=2, padx=2)
+        if self.dropdown_frame is None:
+            self.create_dropdown_menu()
 
-            self.dropdown_frame.update_idletasks()
+        x = self.menu_button.winfo_rootx()
+        y = self.menu_button.winfo_rooty() + self.menu_button.winfo_height()
+        button_width = self.menu_button.winfo_width()
 
-            frame_width = self.dropdown_frame.winfo_width()
-            centered_x = x + (button_width - frame_width) // 2
+        self.dropdown_frame.update_idletasks()
 
-            self.dropdown_frame.geometry(f"+{centered_x}+{y}")
+        frame_width = self.dropdown_frame.winfo_reqwidth()
+        centered_x = x + (button_width - frame_width) // 2
 
-            self.dropdown_frame.bind("<FocusOut>", lambda e: self.toggle_menu())
-            self.root.bind("<Button-1>", self.close_dropdown_on_click)
+        self.dropdown_frame.geometry(f"+{centered_x}+{y}")
+        self.dropdown_frame.deiconify()
+        self.dropdown_visible = True
+
+    def hide_menu(self):
+        if self.dropdown_visible:
+            self.dropdown_frame.withdraw()
+            self.dropdown_visible = False
 
     def change_page(self, page):
-        for p, btn in self.page_buttons.items():
-            if p == page:
-                self.style.configure("Rounded.TButton", background=self.button_active)
-            else:
-                self.style.configure("Rounded.TButton", background=self.button_inactive)
+        # Only the previous and the new page button change style
+        btn = self.page_buttons.get(page)
+        if btn is not self._active_page_btn:
+            if self._active_page_btn is not None:
+                self._active_page_btn.configure(style="Rounded.TButton")
+            if btn is not None:
+                btn.configure(style="Active.Rounded.TButton")
+            self._active_page_btn = btn
 
         self.current_page = page
 
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        # Pages are built once and then only hidden/shown
+        for frame in self._pages.values():
+            frame.pack_forget()
+
+        if page not in self._pages:
+            self._pages[page] = self._build_page(page)
+        self._pages[page].pack(fill=tk.BOTH, expand=True)
+        self._scroll_canvas = self._page_canvases.get(page)
+
+    def _build_page(self, page):
+        frame = tk.Frame(self.content_frame, bg=self.bg_dark)
 
         if page == 'configuration':
-            self.show_configuration_page()
+            self.show_configuration_page(frame)
         elif page == 'optimization':
-            self.show_optimization_page()
+            self.show_optimization_page(frame)
         else:
-            label = tk.Label(self.content_frame, text=f"{page.upper()} - Coming soon",
+            label = tk.Label(frame, text=f"{page.upper()} - Coming soon",
                              font=('Arial', 20), bg=self.bg_dark, fg=self.text_color)
             label.pack(expand=True)
 
-    def show_configuration_page(self):
-        canvas = tk.Canvas(self.content_frame, bg=self.bg_dark, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        return frame
+
+    def _on_mousewheel(self, event):
+        if self._scroll_canvas is None or self.search_popup_active:
+            return
+
+        widget = event.widget
+        while widget is not None:
+            if isinstance(widget, tk.Listbox):
+                parent = widget.master
+                if parent and parent.master and parent.master.winfo_class() == 'TCombobox':
+                    return
+            widget = widget.master
+
+        steps = max(-3, min(3, int(-event.delta / 120)))
+        self._scroll_canvas.yview_scroll(steps, "units")
+
+    def show_configuration_page(self, parent):
+        canvas = tk.Canvas(parent, bg=self.bg_dark, highlightthickness=0)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.bg_dark)
+        scrollable_frame.columnconfigure(0, weight=1)
 
+        canvas._bbox_after_id = None
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: self._schedule_bbox_update(c)
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -458,10 +575,11 @@ class HybridRocketGUI:
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        self._page_canvases['configuration'] = canvas
 
         title = tk.Label(scrollable_frame, text="configuration",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
-        title.pack(pady=(0, 20))
+        title.grid(row=self._next_grid_row(scrollable_frame), column=0, pady=(0, 20))
 
         self.create_line_section(scrollable_frame)
         self.create_fuel_oxidiser_section(scrollable_frame)
@@ -469,39 +587,27 @@ class HybridRocketGUI:
         self.create_nozzle_section(scrollable_frame)
 
         save_button_frame = tk.Frame(scrollable_frame, bg=self.bg_dark)
-        save_button_frame.pack(fill=tk.X, pady=(20, 0))
+        save_button_frame.grid(row=self._next_grid_row(scrollable_frame), column=0,
+                               sticky="ew", pady=(20, 0))
 
         save_btn = ttk.Button(save_button_frame, text="Save Configuration",
                               style="Rounded.TButton",
                               command=self.validate_and_save)
         save_btn.pack(pady=10)
 
+        self._update_bbox(canvas)
         self.validate_inputs()
 
-        def _on_mousewheel(event):
-            if hasattr(self, 'search_popup_active') and self.search_popup_active:
-                return
-
-            widget = event.widget
-            while widget is not None:
-                if isinstance(widget, tk.Listbox):
-                    parent = widget.master
-                    if parent and parent.master and parent.master.winfo_class() == 'TCombobox':
-                        return
-                widget = widget.master
-
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-    def show_optimization_page(self):
-        canvas = tk.Canvas(self.content_frame, bg=self.bg_dark, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+    def show_optimization_page(self, parent):
+        canvas = tk.Canvas(parent, bg=self.bg_dark, highlightthickness=0)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.bg_dark)
+        scrollable_frame.columnconfigure(0, weight=1)
 
+        canvas._bbox_after_id = None
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: self._schedule_bbox_update(c)
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -509,42 +615,47 @@ class HybridRocketGUI:
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        self._page_canvases['optimization'] = canvas
 
         title = tk.Label(scrollable_frame, text="optimization",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
-        title.pack(pady=(0, 20))
+        title.grid(row=self._next_grid_row(scrollable_frame), column=0, pady=(0, 20))
 
         self.create_optimization_section(scrollable_frame)
 
         save_button_frame = tk.Frame(scrollable_frame, bg=self.bg_dark)
-        save_button_frame.pack(fill=tk.X, pady=(20, 0))
+        save_button_frame.grid(row=self._next_grid_row(scrollable_frame), column=0,
+                               sticky="ew", pady=(20, 0))
 
         save_btn = ttk.Button(save_button_frame, text="Save Optimization",
                               style="Rounded.TButton",
                               command=self.validate_and_save_optimization)
         save_btn.pack(pady=10)
 
+        self._update_bbox(canvas)
         self.validate_inputs()
 
-        def _on_mousewheel(event):
-            if hasattr(self, 'search_popup_active') and self.search_popup_active:
-                return
-
-            widget = event.widget
-            while widget is not None:
-                if isinstance(widget, tk.Listbox):
-                    parent = widget.master
-                    if parent and parent.master and parent.master.winfo_class() == 'TCombobox':
-                        return
-                widget = widget.master
+    def _next_grid_row(self, parent):
+        """Return the next free grid row of a page frame, kept on the frame itself"""
+        row = getattr(parent, '_grid_row', 0)
+        parent._grid_row = row + 1
+        return row
 
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    def _schedule_bbox_update(self, canvas):
+        """Coalesce scrollable frame <Configure> events into one scrollregion update"""
+        if canvas._bbox_after_id is None:
+            canvas._bbox_after_id = self.root.after(16, lambda: self._update_bbox(canvas))
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+    def _update_bbox(self, canvas):
+        if canvas._bbox_after_id is not None:
+            self.root.after_cancel(canvas._bbox_after_id)
+            canvas._bbox_after_id = None
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=canvas.bbox("all"))
 
     def create_line_section(self, parent):
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
-        section.pack(fill=tk.X, pady=10, ipady=15)
+        section.grid(row=self._next_grid_row(parent), column=0, sticky="ew", pady=10, ipady=15)
 
         header_frame = tk.Frame(section, bg=self.bg_light)
         header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -584,7 +695,7 @@ class HybridRocketGUI:
 
     def create_fuel_oxidiser_section(self, parent):
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
-        section.pack(fill=tk.X, pady=10, ipady=15)
+        section.grid(row=self._next_grid_row(parent), column=0, sticky="ew", pady=10, ipady=15)
 
         header_frame = tk.Frame(section, bg=self.bg_light)
         header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -608,8 +719,8 @@ class HybridRocketGUI:
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="(Ox) Oxidizer:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="(Ox) Oxidizer:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
         combo = ttk.Combobox(row, font=('Arial', 11), width=28,
@@ -622,13 +733,12 @@ class HybridRocketGUI:
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Weight fraction:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="Weight fraction:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light, state='readonly')
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS, state='readonly')
         entry.insert(0, "100")
         entry.pack(side=tk.LEFT)
 
@@ -668,36 +778,34 @@ class HybridRocketGUI:
         row = tk.Frame(self.oxidizer_dynamic_frame, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Temperature [K]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="Temperature [K]:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
         if temp_default:
             entry.insert(0, str(temp_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Fuel & Oxidiser_Oxidizer_Temperature"] = entry
+        self._register_input("Fuel & Oxidiser_Oxidizer_Temperature", entry)
 
         row = tk.Frame(self.oxidizer_dynamic_frame, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Specific Enthalpy [kJ/mol]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="Specific Enthalpy [kJ/mol]:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
         if enthalpy_default:
             entry.insert(0, str(enthalpy_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Fuel & Oxidiser_Oxidizer_SpecificEnthalpy"] = entry
+        self._register_input("Fuel & Oxidiser_Oxidizer_SpecificEnthalpy", entry)
 
         self.validate_inputs()
 
@@ -705,8 +813,8 @@ class HybridRocketGUI:
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="(F) Fuel:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="(F) Fuel:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
         select_btn = ttk.Button(row, text="Select Fuels", style="Rounded.TButton",
@@ -779,42 +887,40 @@ class HybridRocketGUI:
         row = tk.Frame(self.fuel_dynamic_frame, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Fuel Temperature [K]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="Fuel Temperature [K]:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
         if temp_default:
             entry.insert(0, str(temp_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Fuel & Oxidiser_Fuel_Temperature"] = entry
+        self._register_input("Fuel & Oxidiser_Fuel_Temperature", entry)
 
         row = tk.Frame(self.fuel_dynamic_frame, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Fuel Specific Enthalpy [kJ/mol]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="Fuel Specific Enthalpy [kJ/mol]:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
         if enthalpy_default:
             entry.insert(0, str(enthalpy_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Fuel & Oxidiser_Fuel_SpecificEnthalpy"] = entry
+        self._register_input("Fuel & Oxidiser_Fuel_SpecificEnthalpy", entry)
 
         self.validate_inputs()
 
     def create_injector_section(self, parent):
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
-        section.pack(fill=tk.X, pady=10, ipady=15)
+        section.grid(row=self._next_grid_row(parent), column=0, sticky="ew", pady=10, ipady=15)
 
         header_frame = tk.Frame(section, bg=self.bg_light)
         header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -834,7 +940,7 @@ class HybridRocketGUI:
 
     def create_nozzle_section(self, parent):
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
-        section.pack(fill=tk.X, pady=10, ipady=15)
+        section.grid(row=self._next_grid_row(parent), column=0, sticky="ew", pady=10, ipady=15)
 
         header_frame = tk.Frame(section, bg=self.bg_light)
         header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -852,17 +958,16 @@ class HybridRocketGUI:
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="(ε) eps:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text="(ε) eps:",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
-        entry.bind('<KeyRelease>', lambda e: self.validate_epsilon())
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Nozzle_epsilon"] = entry
+        self._register_input("Nozzle_epsilon", entry)
 
     def validate_epsilon(self):
         entry = self.inputs["Nozzle_epsilon"]
@@ -872,25 +977,20 @@ class HybridRocketGUI:
         if value:
             if value.lower() == "adapt":
                 is_valid = True
-            else:
-                try:
-                    float_val = float(value)
-                    if float_val > 1:
-                        is_valid = True
-                except ValueError:
-                    pass
+            elif _is_float(value) and float(value) > 1:
+                is_valid = True
 
         if is_valid:
-            entry.configure(highlightbackground='#00aa00', highlightcolor='#00aa00')
+            self._set_highlight(entry, self.valid_color)
         else:
-            entry.configure(highlightbackground='red', highlightcolor='red')
+            self._set_highlight(entry, self.invalid_color)
 
-        self.validate_inputs()
+        self._set_input_state("Nozzle_epsilon", is_valid)
 
     def create_optimization_section(self, parent):
         """Create the Optimization section"""
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
-        section.pack(fill=tk.X, pady=10, ipady=15)
+        section.grid(row=self._next_grid_row(parent), column=0, sticky="ew", pady=10, ipady=15)
 
         header_frame = tk.Frame(section, bg=self.bg_light)
         header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -925,16 +1025,16 @@ class HybridRocketGUI:
 
     def create_float_field(self, parent, section, var_name, display_name, min_value=None,
                            max_value=None, exclusive=False):
+        key = sys.intern(f"{section}_{var_name}")
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text=display_name + ":", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text=display_name + ":",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
 
         entry.validation_params = {
@@ -943,23 +1043,23 @@ class HybridRocketGUI:
             'exclusive': exclusive
         }
 
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs[f"{section}_{var_name}"] = entry
+        self._register_input(key, entry)
 
     def create_int_field(self, parent, section, var_name, display_name, min_value=None,
                          max_value=None, exclusive=False):
         """Create an integer input field"""
+        key = sys.intern(f"{section}_{var_name}")
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text=display_name + ":", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
+        label = tk.Label(row, text=display_name + ":",
+                         bg=self.bg_light, fg='black', width=25, **_LABEL_OPTS)
         label.pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        entry = tk.Entry(row, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
         entry.pack(side=tk.LEFT)
 
         entry.validation_params = {
@@ -969,131 +1069,166 @@ class HybridRocketGUI:
             'is_int': True
         }
 
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
+
+        self._register_input(key, entry)
+
+    def _register_input(self, key, entry):
+        """Store an entry and seed its validation state as invalid"""
+        # Interned so the validation lookups below compare keys by identity
+        key = sys.intern(key)
+        if self._valid_state.pop(key, True) is False:
+            self._invalid_count -= 1
+        old_entry = self.inputs.get(key)
+        if old_entry is not None:
+            self._entry_to_key.pop(id(old_entry), None)
+        self.inputs[key] = entry
+        self._entry_to_key[id(entry)] = key
+        self._valid_state[key] = False
+        self._invalid_count += 1
+
+    def _check_input(self, key, entry, value):
+        """Return whether the value of a single entry is valid"""
+        if not value:
+            return False
+
+        if "CustomName" in key or "ExpandedFormula" in key:
+            return True
+
+        if key == "Nozzle_epsilon":
+            if value.lower() == "adapt":
+                return True
+            return _is_float(value) and float(value) > 1
+
+        if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
+            if not _INT_RE.match(value):
+                return False
+            float_val = float(int(value))
+        else:
+            if not _is_float(value):
+                return False
+            float_val = float(value)
+
+        if hasattr(entry, 'validation_params'):
+            params = entry.validation_params
+
+            if params.get('min_value') is not None:
+                if params.get('exclusive'):
+                    if not (float_val > params['min_value']):
+                        return False
+                elif not (float_val >= params['min_value']):
+                    return False
+
+            if params.get('max_value') is not None:
+                if params.get('exclusive'):
+                    if not (float_val < params['max_value']):
+                        return False
+                elif not (float_val <= params['max_value']):
+                    return False
+
+        return True
+
+    def _saved_value(self, key, entry, value):
+        """Return the form an entry's non-empty value is saved in"""
+        if "CustomName" in key or "ExpandedFormula" in key:
+            return value
+        if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
+            return int(value) if _INT_RE.match(value) else value
+        return float(value) if _is_float(value) else value
+
+    def _set_input_state(self, key, is_valid):
+        """Update the validity of one entry and refresh the save button on zero crossings"""
+        was_valid = self._valid_state.get(key, True)
+        self._valid_state[key] = is_valid
+        if was_valid == is_valid:
+            return
 
-        self.inputs[f"{section}_{var_name}"] = entry
+        was_clear = self._invalid_count == 0
+        self._invalid_count += -1 if is_valid else 1
+        if was_clear != (self._invalid_count == 0):
+            self._update_save_button()
+
+    def _update_save_button(self):
+        if self._invalid_count == 0 and self._extras_valid:
+            new_bg = self.button_valid
+        else:
+            new_bg = self.button_invalid
+        if new_bg != self._save_btn_bg:
+            self.style.configure("Rounded.TButton", background=new_bg)
+            self._save_btn_bg = new_bg
+
+    def _on_entry_keyrelease(self, event):
+        key = self._entry_to_key.get(id(event.widget))
+        if key == "Nozzle_epsilon":
+            self.validate_epsilon()
+        elif key is not None:
+            self._schedule_validate(event.widget)
+
+    def _schedule_validate(self, entry):
+        """Coalesce keystrokes so an entry is validated once the user pauses typing"""
+        pending = self._pending_validate.pop(id(entry), None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_validate[id(entry)] = self.root.after(50, lambda: self._do_validate(entry))
+
+    def _do_validate(self, entry):
+        self._pending_validate.pop(id(entry), None)
+        if entry.winfo_exists():
+            self.validate_single_input(entry)
+
+    def _set_highlight(self, entry, color):
+        """Change the border color of an entry, skipping no-op reconfigures"""
+        if getattr(entry, '_hl_color', None) != color:
+            entry.configure(highlightbackground=color, highlightcolor=color)
+            entry._hl_color = color
 
     def validate_single_input(self, entry):
         """Validate a single input field"""
         value = entry.get().strip()
-        is_valid = False
-
-        if value:
-            field_key = None
-            for key, val in self.inputs.items():
-                if val == entry:
-                    field_key = key
-                    break
-
-            if field_key and ("CustomName" in field_key or "ExpandedFormula" in field_key):
-                is_valid = len(value) > 0
-            else:
-                try:
-                    if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
-                        int_val = int(value)
-                        float_val = float(int_val)
-                    else:
-                        float_val = float(value)
-                    is_valid = True
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val > params['min_value']
-                            else:
-                                is_valid = is_valid and float_val >= params['min_value']
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val < params['max_value']
-                            else:
-                                is_valid = is_valid and float_val <= params['max_value']
-                except ValueError:
-                    is_valid = False
+        field_key = self._entry_to_key.get(id(entry))
+        is_valid = field_key is not None and self._check_input(field_key, entry, value)
 
         if is_valid:
-            entry.configure(highlightbackground='#00aa00', highlightcolor='#00aa00')
+            self._set_highlight(entry, self.valid_color)
         elif value:
-            entry.configure(highlightbackground='red', highlightcolor='red')
+            self._set_highlight(entry, self.invalid_color)
         else:
-            entry.configure(highlightbackground=self.bg_light, highlightcolor=self.bg_light)
+            self._set_highlight(entry, self.bg_light)
 
-        self.validate_inputs()
+        if field_key is not None:
+            self._set_input_state(field_key, is_valid)
 
     def validate_inputs(self):
-        all_valid = True
+        """Rebuild the validation state of every input in one pass"""
+        self._valid_state = {}
+        self._invalid_count = 0
 
         for key, entry in self.inputs.items():
             if isinstance(entry, str):
                 continue
 
             value = entry.get().strip()
-            if not value:
-                all_valid = False
-                continue
-
-            if "CustomName" in key or "ExpandedFormula" in key:
-                if not value:
-                    all_valid = False
-            else:
-                try:
-                    if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
-                        int_val = int(value)
-                        float_val = float(int_val)
-                    else:
-                        float_val = float(value)
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val > params['min_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val >= params['min_value']):
-                                    all_valid = False
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val < params['max_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val <= params['max_value']):
-                                    all_valid = False
-                except ValueError:
-                    all_valid = False
+            is_valid = self._check_input(key, entry, value)
+            self._valid_state[key] = is_valid
+            if not is_valid:
+                self._invalid_count += 1
 
-        if "Nozzle_epsilon" in self.inputs:
-            eps_value = self.inputs["Nozzle_epsilon"].get().strip()
-            if eps_value:
-                if eps_value.lower() != "adapt":
-                    try:
-                        if float(eps_value) <= 1:
-                            all_valid = False
-                    except ValueError:
-                        all_valid = False
-            else:
-                all_valid = False
+        # Checked whichever page triggered the pass, the save button style is shared
+        extras_valid = True
 
-        if self.current_page == 'configuration':
-            if not self.selected_fuels or not self.fuel_weight_entries:
-                all_valid = False
-            else:
-                total = sum(self.fuel_weight_entries.values())
-                if abs(total - 100) > 0.01:
-                    all_valid = False
+        if not self.selected_fuels or not self.fuel_weight_entries:
+            extras_valid = False
+        else:
+            total = sum(self.fuel_weight_entries.values())
+            if abs(total - 100) > 0.01:
+                extras_valid = False
 
         for key, combo in self.dropdowns.items():
             if not combo.get():
-                all_valid = False
+                extras_valid = False
 
-        if all_valid:
-            self.style.configure("Rounded.TButton", background='#006400')
-        else:
-            self.style.configure("Rounded.TButton", background='#8b0000')
+        self._extras_valid = extras_valid
+        self._update_save_button()
 
     def import_line_placeholder(self):
         messagebox.showinfo("Info", "Import line function in development")
@@ -1114,15 +1249,13 @@ class HybridRocketGUI:
 
             if "CustomName" in key or "ExpandedFormula" in key:
                 config[key] = value
+            elif _is_float(value):
+                config[key] = float(value)
+            elif key == "Nozzle_epsilon" and value.lower() == "adapt":
+                config[key] = value
             else:
-                try:
-                    config[key] = float(value)
-                except ValueError:
-                    if key == "Nozzle_epsilon" and value.lower() == "adapt":
-                        config[key] = value
-                    else:
-                        all_valid = False
-                        break
+                all_valid = False
+                break
 
         for key, combo in self.dropdowns.items():
             value = combo.get()
@@ -1154,12 +1287,14 @@ class HybridRocketGUI:
                 all_valid = False
                 break
 
-            try:
-                if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
-                    config[key] = int(value)
-                else:
-                    config[key] = float(value)
-            except ValueError:
+            if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
+                if not _INT_RE.match(value):
+                    all_valid = False
+                    break
+                config[key] = int(value)
+            elif _is_float(value):
+                config[key] = float(value)
+            else:
                 all_valid = False
                 break
 
@@ -1184,6 +1319,7 @@ class HybridRocketGUI:
             self._save_to_file(filename)
 
     def _save_to_file(self, filename):
+        # Read every entry now, pending debounced validations may not have run yet
         config = {}
 
         for key, entry in self.inputs.items():
@@ -1193,16 +1329,7 @@ class HybridRocketGUI:
 
             value = entry.get().strip()
             if value:
-                if "CustomName" in key or "ExpandedFormula" in key:
-                    config[key] = value
-                else:
-                    try:
-                        if hasattr(entry, 'validation_params') and entry.validation_params.get('is_int'):
-                            config[key] = int(value)
-                        else:
-                            config[key] = float(value)
-                    except ValueError:
-                        config[key] = value
+                config[key] = self._saved_value(key, entry, value)
 
         for key, combo in self.dropdowns.items():
             value = combo.get()
@@ -1212,8 +1339,8 @@ class HybridRocketGUI:
         config['selected_fuels'] = self.selected_fuels
         config['fuel_weight_entries'] = self.fuel_weight_entries
 
-        with open(filename, 'w') as f:
-            json.dump(config, f, indent=4)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(_CONFIG_ENCODER.encode(config))
 
         messagebox.showinfo("Saved", f"Configuration saved to:\n{filename}")
 
@@ -1223,7 +1350,7 @@ class HybridRocketGUI:
         )
         if filename:
             try:
-                with open(filename, 'r') as f:
+                with open(filename, 'r', encoding='utf-8') as f:
                     config = json.load(f)
 
                 for key, value in config.items():
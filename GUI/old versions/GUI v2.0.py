@@ -2,7 +2,9 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import json
 import os
+import queue
 import re
+import threading
 
 # Try to import ttkbootstrap for modern theming
 try:
@@ -24,6 +26,75 @@ except ImportError:
     print("Warning: CoolProp not available. Using fallback oxidizer list.")
 
 
+# One comma separated weight fraction, e.g. "60, 40"
+_FRAC_RE = re.compile(r'\s*((?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)\s*(?:,|$)')
+
+
+def _parse_fractions(value):
+    """Return the list of fractions in value, or None if it is not a clean list"""
+    fractions = []
+    pos = 0
+    for match in _FRAC_RE.finditer(value):
+        if match.start() != pos:
+            return None
+        fractions.append(float(match.group(1)))
+        pos = match.end()
+    if pos != len(value) or value.endswith(','):
+        return None
+    return fractions
+
+
+# Hover handlers of the 'HoverButton' bindtag: each button carries its own
+# _hover_bg / _normal_bg
+def _hover_enter(event):
+    event.widget.config(bg=event.widget._hover_bg)
+
+
+def _hover_leave(event):
+    event.widget.config(bg=event.widget._normal_bg)
+
+
+def _get_parsed(entry):
+    """Return (text, float value or None, last validity) of an entry.
+
+    The float parse is only redone when the text changed; validity is reset
+    to None in that case and stored back by the entry's validator.
+    """
+    text = entry.get().strip()
+    if text != getattr(entry, '_cached_text', None):
+        try:
+            float_val = float(text)
+        except ValueError:
+            float_val = None
+        entry._cached_text = text
+        entry._cached_float = float_val
+        entry._cached_valid = None
+    return text, entry._cached_float, entry._cached_valid
+
+
+def _make_validator(entry, key, min_value, max_value, exclusive, paint, on_change):
+    """Build the <KeyRelease> validator of one entry with its bounds bound as locals"""
+    def validate(event=None):
+        value, float_val, cached_valid = _get_parsed(entry)
+        if event is not None and cached_valid is not None:
+            # Key release that did not change the text (arrows, shift, ...)
+            return
+        is_valid = False
+
+        if float_val is not None:
+            is_valid = True
+            if min_value is not None:
+                is_valid = float_val > min_value if exclusive else float_val >= min_value
+            if is_valid and max_value is not None:
+                is_valid = float_val < max_value if exclusive else float_val <= max_value
+
+        entry._cached_valid = is_valid
+        paint(entry, value, is_valid)
+        on_change(key, is_valid)
+
+    return validate
+
+
 class HybridRocketGUI:
     def __init__(self, root):
         self.root = root
@@ -33,6 +104,7 @@ class HybridRocketGUI:
 
         # Maximize the window
         self.root.state('zoomed')
+        self._screen_width = self.root.winfo_screenwidth()
 
         # Modern color scheme
         self.colors = {
@@ -51,10 +123,27 @@ class HybridRocketGUI:
             'input_bg': '#ffffff',
         }
 
+        # ttk entry style for each validation state, see setup_styles
+        self._STYLE_NAMES = {'valid': 'Valid.TEntry',
+                             'invalid': 'Invalid.TEntry',
+                             'neutral': 'Neutral.TEntry'}
+
         # Variables for inputs
         self.inputs = {}
         self.dropdowns = {}
+        self._dropdown_built = False
         self.current_page = 'configuration'
+        # Reverse index of self.inputs: entry widget -> key
+        self._entry_to_key = {}
+        self._validators = {}
+        # Keys of the entries that are currently empty or invalid
+        self._invalid = set()
+        # Keys of the dropdowns with no selection yet
+        self._unset_dropdowns = set()
+        self._pending_global = None
+
+        # Configuration cards not built yet: placeholder frame -> builder
+        self._pending_sections = {}
 
         # Load reactant lists
         self.load_reactant_lists()
@@ -65,6 +154,10 @@ class HybridRocketGUI:
         # Define custom styles
         self.setup_styles()
 
+        # Hover effect for every button tagged 'HoverButton', registered once
+        self.root.bind_class('HoverButton', '<Enter>', _hover_enter)
+        self.root.bind_class('HoverButton', '<Leave>', _hover_leave)
+
         # Create main layout
         self.create_header()
         self.create_sidebar()
@@ -73,8 +166,24 @@ class HybridRocketGUI:
         self.content_frame = tk.Frame(self.root, bg=self.colors['bg_primary'])
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=0, pady=0)
 
+        # One frame per page, built on first visit and then only shown/hidden
+        self._page_frames = {}
+        self._page_canvases = {}
+
+        # Mouse wheel scrolling, bound once for the whole application
+        self._active_scroll_canvas = None
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
+        # Saves are written in order by one background writer
+        self._save_queue = queue.Queue()
+        # Outcomes reported back by the writer, shown from the Tk thread
+        self._save_results = queue.Queue()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(100, self._drain_save_results)
+
         # Show configuration page
-        self.show_configuration_page()
+        self.change_page('configuration')
 
     def setup_styles(self):
         """Configure modern styles for widgets"""
@@ -111,6 +220,15 @@ class HybridRocketGUI:
                                  font=('Segoe UI', 10),
                                  padding=5)
 
+        # Validation states of the input entries
+        entry_style = ttk.Style()
+        for name, field_bg, border in (('Valid.TEntry', '#e8f5e9', self.colors['success']),
+                                       ('Invalid.TEntry', '#ffebee', self.colors['error']),
+                                       ('Neutral.TEntry', self.colors['input_bg'],
+                                        self.colors['border'])):
+            entry_style.configure(name, fieldbackground=field_bg, bordercolor=border,
+                                  lightcolor=border, padding=4)
+
     def load_reactant_lists(self):
         """Load reactant lists from CEA_reactants.txt and CoolProp"""
         self.cea_reactants = []
@@ -129,6 +247,14 @@ class HybridRocketGUI:
         self.easy_cea_fuel_list = ["CH4", "CH4(L)", "H2", "H2(L)", "RP-1", "paraffin",
                                    "Select other options", "Custom with exploded formula"]
 
+        # Special dropdown entries dispatch to their own handler, anything
+        # else is a plain reactant
+        self._ox_handlers = {"Select other options": self._search_oxidizer,
+                             "Custom with exploded formula": self._custom_oxidizer}
+        self._fuel_handlers = {"Select other options": self._search_fuel,
+                               "Custom with exploded formula": self._custom_fuel,
+                               "paraffin": lambda: self.create_fuel_dynamic_fields(533.0, -1860.6)}
+
         if COOLPROP_AVAILABLE:
             self.coolprop_fluids = cp.FluidsList()
         else:
@@ -413,88 +539,107 @@ class HybridRocketGUI:
                             command=lambda p=page: self.change_page(p))
             btn.pack(fill=tk.X)
 
-            # Hover effect
-            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.colors['accent']))
-            btn.bind('<Leave>', lambda e, b=btn, p=page: b.config(
-                bg=self.colors['accent'] if self.current_page == p else self.colors['bg_sidebar']))
+            # Hover effect (_normal_bg follows the current page, see change_page)
+            btn._hover_bg = self.colors['accent']
+            btn._normal_bg = self.colors['bg_sidebar']
+            btn.bindtags(('HoverButton',) + btn.bindtags())
 
             self.page_buttons[page] = btn
 
         # Update initial button state
+        self.page_buttons['configuration']._normal_bg = self.colors['accent']
         self.page_buttons['configuration'].config(bg=self.colors['accent'])
 
     def toggle_menu(self):
         """Toggle dropdown menu"""
-        if hasattr(self, 'dropdown_frame') and self.dropdown_frame:
-            self.dropdown_frame.destroy()
-            self.dropdown_frame = None
+        if not self._dropdown_built:
+            self.create_dropdown_menu()
+
+        if self.dropdown_frame.winfo_viewable():
+            self.hide_menu()
         else:
             x = self.menu_button.winfo_rootx()
             y = self.menu_button.winfo_rooty() + self.menu_button.winfo_height()
-
-            self.dropdown_frame = tk.Toplevel(self.root)
-            self.dropdown_frame.overrideredirect(True)
             self.dropdown_frame.geometry(f"160x120+{x}+{y}")
-            self.dropdown_frame.configure(bg=self.colors['bg_secondary'])
-
-            # Add shadow effect (simple border)
-            self.dropdown_frame.configure(highlightthickness=1,
-                                          highlightbackground=self.colors['border'])
-
-            menu_items = [
-                ("💾 Save", self.save_config),
-                ("💾 Save As", self.save_config_as),
-                ("📂 Open", self.open_config)
-            ]
-
-            for text, cmd in menu_items:
-                btn = tk.Button(self.dropdown_frame, text=text,
-                                font=('Segoe UI', 10),
-                                bg=self.colors['bg_secondary'],
-                                fg=self.colors['text_primary'],
-                                activebackground=self.colors['border'],
-                                relief=tk.FLAT, anchor='w',
-                                padx=15, pady=8,
-                                cursor='hand2',
-                                command=lambda c=cmd: (c(), self.toggle_menu()))
-                btn.pack(fill=tk.X)
-
-                # Hover effect
-                btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.colors['border']))
-                btn.bind('<Leave>', lambda e, b=btn: b.config(bg=self.colors['bg_secondary']))
-
-            self.dropdown_frame.bind("<FocusOut>", lambda e: self.toggle_menu())
+            self.dropdown_frame.deiconify()
+            self.dropdown_frame.lift()
+
+    def hide_menu(self):
+        if self._dropdown_built:
+            self.dropdown_frame.withdraw()
+
+    def create_dropdown_menu(self):
+        """Build the dropdown Toplevel and its buttons once; it is then only shown or hidden"""
+        self.dropdown_frame = tk.Toplevel(self.root)
+        self.dropdown_frame.overrideredirect(True)
+        self.dropdown_frame.withdraw()
+        self.dropdown_frame.configure(bg=self.colors['bg_secondary'])
+
+        # Add shadow effect (simple border)
+        self.dropdown_frame.configure(highlightthickness=1,
+                                      highlightbackground=self.colors['border'])
+
+        menu_items = [
+            ("💾 Save", self.save_config),
+            ("💾 Save As", self.save_config_as),
+            ("📂 Open", self.open_config)
+        ]
+
+        for text, cmd in menu_items:
+            btn = tk.Button(self.dropdown_frame, text=text,
+                            font=('Segoe UI', 10),
+                            bg=self.colors['bg_secondary'],
+                            fg=self.colors['text_primary'],
+                            activebackground=self.colors['border'],
+                            relief=tk.FLAT, anchor='w',
+                            padx=15, pady=8,
+                            cursor='hand2',
+                            command=lambda c=cmd: (c(), self.hide_menu()))
+            btn.pack(fill=tk.X)
+
+            # Hover effect
+            btn._hover_bg = self.colors['border']
+            btn._normal_bg = self.colors['bg_secondary']
+            btn.bindtags(('HoverButton',) + btn.bindtags())
+
+        self.dropdown_frame.bind("<FocusOut>", lambda e: self.hide_menu())
+        self._dropdown_built = True
 
     def change_page(self, page):
         """Change active page"""
         # Update button colors
         for p, btn in self.page_buttons.items():
             if p == page:
-                btn.config(bg=self.colors['accent'])
+                btn._normal_bg = self.colors['accent']
             else:
-                btn.config(bg=self.colors['bg_sidebar'])
-
-        self.current_page = page
-
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+                btn._normal_bg = self.colors['bg_sidebar']
+            btn.config(bg=btn._normal_bg)
 
-        if page == 'configuration':
-            self.show_configuration_page()
-        else:
-            placeholder = tk.Frame(self.content_frame, bg=self.colors['bg_primary'])
-            placeholder.pack(expand=True, fill=tk.BOTH)
+        previous = self._page_frames.get(self.current_page)
+        if previous is not None:
+            previous.pack_forget()
 
-            label = tk.Label(placeholder, text=f"{page.upper()}\nComing soon",
-                             font=('Segoe UI', 24), bg=self.colors['bg_primary'],
-                             fg=self.colors['text_secondary'])
-            label.pack(expand=True)
+        self.current_page = page
 
-    def show_configuration_page(self):
+        frame = self._page_frames.get(page)
+        if frame is None:
+            frame = tk.Frame(self.content_frame, bg=self.colors['bg_primary'])
+            if page == 'configuration':
+                self.show_configuration_page(frame)
+            else:
+                label = tk.Label(frame, text=f"{page.upper()}\nComing soon",
+                                 font=('Segoe UI', 24), bg=self.colors['bg_primary'],
+                                 fg=self.colors['text_secondary'])
+                label.pack(expand=True)
+            self._page_frames[page] = frame
+        frame.pack(expand=True, fill=tk.BOTH)
+        self._active_scroll_canvas = self._page_canvases.get(page)
+
+    def show_configuration_page(self, parent):
         """Show modern configuration page"""
         # Main container with padding
         # Create a frame to center the content
-        center_container = tk.Frame(self.content_frame, bg=self.colors['bg_primary'])
+        center_container = tk.Frame(parent, bg=self.colors['bg_primary'])
         center_container.pack(fill=tk.BOTH, expand=True)
         
         # Main container with max width constraint
@@ -502,9 +647,7 @@ class HybridRocketGUI:
         main_container.pack(fill=tk.BOTH, expand=True, padx=50, pady=30, anchor='center')
         
         # Set a minimum width for the main container
-        main_container.update_idletasks()
-        screen_width = self.root.winfo_screenwidth()
-        min_width = int(screen_width * 0.7)  # 70% of screen width
+        min_width = int(self._screen_width * 0.7)  # 70% of screen width
         main_container.configure(width=min_width)
 
         # Title
@@ -521,22 +664,39 @@ class HybridRocketGUI:
                                  command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.colors['bg_primary'])
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # The frame size is the scroll region, no need to walk every item with bbox
+        def on_frame_configure(event):
+            canvas.configure(scrollregion=(0, 0, event.width, event.height))
+
+        scrollable_frame.bind("<Configure>", on_frame_configure)
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self._realize_visible_sections(canvas, float(first), float(last))
+
+        canvas.configure(yscrollcommand=on_yscroll)
+        canvas.bind("<Configure>", lambda e: self._realize_visible_sections(
+            canvas, *canvas.yview()))
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Create sections
-        self.create_line_section(scrollable_frame)
-        self.create_fuel_oxidiser_section(scrollable_frame)
-        self.create_injector_section(scrollable_frame)
-        self.create_nozzle_section(scrollable_frame)
+        # Create sections: placeholders with an estimated height, each card is
+        # built when it scrolls near the viewport
+        self._section_placeholders = []
+        for build_fn, height in ((self.create_line_section, 110),
+                                 (self.create_fuel_oxidiser_section, 900),
+                                 (self.create_injector_section, 330),
+                                 (self.create_nozzle_section, 170)):
+            placeholder = tk.Frame(scrollable_frame, bg=self.colors['bg_primary'],
+                                   height=height)
+            placeholder.pack(fill=tk.X)
+            placeholder.pack_propagate(False)
+            self._section_placeholders.append(placeholder)
+            self._pending_sections[placeholder] = build_fn
+        self._realize_section(self._section_placeholders[0])
 
         # Save button
         save_frame = tk.Frame(scrollable_frame, bg=self.colors['bg_primary'])
@@ -555,33 +715,61 @@ class HybridRocketGUI:
                                       command=self.validate_and_save)
         self.save_btn.pack()
 
+        self._page_canvases['configuration'] = canvas
         self.validate_inputs()
 
-        # Mouse wheel scrolling
-        def _on_mousewheel(event):
-            if self.search_popup_active:
-                return
-            widget = event.widget
-            while widget is not None:
-                if isinstance(widget, tk.Listbox):
-                    parent = widget.master
-                    if parent and parent.master and parent.master.winfo_class() == 'TCombobox':
-                        return
-                widget = widget.master
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    def _on_mousewheel(self, event):
+        canvas = self._active_scroll_canvas
+        if canvas is None or self.search_popup_active:
+            return
+        # Combobox dropdown lists live under "<combobox>.popdown.f.l" and
+        # scroll themselves
+        if '.popdown.' in str(event.widget):
+            return
+        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def _realize_section(self, placeholder):
+        build_fn = self._pending_sections.pop(placeholder, None)
+        if build_fn is not None:
+            placeholder.pack_propagate(True)
+            build_fn(placeholder)
+
+    def _realize_all_sections(self):
+        for placeholder in list(self._pending_sections):
+            self._realize_section(placeholder)
+        self.validate_inputs()
+
+    def _realize_visible_sections(self, canvas, first, last):
+        """Build the cards whose placeholder is within one screen of the viewport"""
+        if not self._pending_sections:
+            return
+        view_height = canvas.winfo_height()
+        if view_height <= 1:
+            return
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        offsets = []
+        total = 0
+        for placeholder in self._section_placeholders:
+            offsets.append(total)
+            total += placeholder.winfo_reqheight()
+
+        top = first * total - view_height
+        bottom = last * total + view_height
+        built = False
+        for placeholder, offset in zip(self._section_placeholders, offsets):
+            if (placeholder in self._pending_sections
+                    and offset < bottom and offset + placeholder.winfo_reqheight() > top):
+                self._realize_section(placeholder)
+                built = True
+        if built:
+            self.validate_inputs()
 
     def create_card(self, parent, title, show_import=False):
         """Create a modern card-style section"""
-        # Create a container to center the card
-        container = tk.Frame(parent, bg=self.colors['bg_primary'])
-        container.pack(fill=tk.X, pady=20)
-        
         # Create the card with a maximum width
-        card = tk.Frame(container, bg=self.colors['bg_secondary'],
+        card = tk.Frame(parent, bg=self.colors['bg_secondary'],
                        relief=tk.FLAT, bd=0)
-        card.pack(fill=tk.X, padx=100)  # Add horizontal padding to limit width
+        card.pack(fill=tk.X, padx=100, pady=20)  # Add horizontal padding to limit width
 
         # Add subtle border
         card.configure(highlightthickness=1, highlightbackground=self.colors['border'])
@@ -648,45 +836,61 @@ class HybridRocketGUI:
         entry.pack(fill=tk.X, ipady=8)
 
         self.inputs["Fuel & Oxidiser_Oxidizer_WeightFraction"] = entry
+        self._entry_to_key[entry] = "Fuel & Oxidiser_Oxidizer_WeightFraction"
 
         # Container for dynamic fields
         self.oxidizer_dynamic_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
         self.oxidizer_dynamic_frame.pack(fill=tk.X)
+        self.oxidizer_dynamic_frame._anchor = row
+        self._ox_dynamic_entries = {}
 
     def on_oxidizer_change(self):
-        for widget in self.oxidizer_dynamic_frame.winfo_children():
-            widget.destroy()
-
+        self._dropdown_changed("Fuel & Oxidiser_Oxidizer")
         oxidizer = self.dropdowns["Fuel & Oxidiser_Oxidizer"].get()
+        self._ox_handlers.get(oxidizer, self.create_oxidizer_dynamic_fields)()
 
-        if oxidizer == "Select other options":
-            def callback(selected):
-                self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(selected)
-                self.on_oxidizer_change()
+    def _search_oxidizer(self):
+        # Hidden only while the popup is pending, standard reactants keep it packed
+        self.oxidizer_dynamic_frame.pack_forget()
 
-            self.show_search_popup("Select Oxidizer", self.cea_reactants, callback)
-            return
+        def callback(selected):
+            self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(selected)
+            self.on_oxidizer_change()
 
-        elif oxidizer == "Custom with exploded formula":
-            def callback(result):
-                self.inputs["Fuel & Oxidiser_Oxidizer_CustomName"] = result['name']
-                self.inputs["Fuel & Oxidiser_Oxidizer_ExpandedFormula"] = result['exploded_formula']
-                self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(f"Custom: {result['name']}")
-                self.create_oxidizer_dynamic_fields(result['temperature'], result['enthalpy'])
+        self.show_search_popup("Select Oxidizer", self.cea_reactants, callback)
 
-            self.show_custom_formula_popup(callback)
-            return
+    def _custom_oxidizer(self):
+        self.oxidizer_dynamic_frame.pack_forget()
+
+        def callback(result):
+            self.inputs["Fuel & Oxidiser_Oxidizer_CustomName"] = result['name']
+            self.inputs["Fuel & Oxidiser_Oxidizer_ExpandedFormula"] = result['exploded_formula']
+            self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(f"Custom: {result['name']}")
+            self.create_oxidizer_dynamic_fields(result['temperature'], result['enthalpy'])
 
-        self.create_oxidizer_dynamic_fields()
+        self.show_custom_formula_popup(callback)
 
     def create_oxidizer_dynamic_fields(self, temp_default=None, enthalpy_default=None):
-        self.create_modern_float_field(self.oxidizer_dynamic_frame, "Fuel & Oxidiser",
-                                       "Oxidizer_Temperature", "Temperature [K]",
-                                       default=temp_default)
-        self.create_modern_float_field(self.oxidizer_dynamic_frame, "Fuel & Oxidiser",
-                                       "Oxidizer_SpecificEnthalpy",
-                                       "Specific Enthalpy [kJ/mol]",
-                                       default=enthalpy_default)
+        self._show_dynamic_fields(self.oxidizer_dynamic_frame, self._ox_dynamic_entries, (
+            ("Oxidizer_Temperature", "Temperature [K]", temp_default),
+            ("Oxidizer_SpecificEnthalpy", "Specific Enthalpy [kJ/mol]", enthalpy_default)))
+
+    def _show_dynamic_fields(self, frame, entries, fields):
+        """Show the temperature/enthalpy rows of a dynamic frame, building them only once"""
+        for var_name, display_name, default in fields:
+            entry = entries.get(var_name)
+            if entry is None:
+                self.create_modern_float_field(frame, "Fuel & Oxidiser", var_name,
+                                               display_name, default=default)
+                entries[var_name] = self.inputs[f"Fuel & Oxidiser_{var_name}"]
+            else:
+                entry.delete(0, tk.END)
+                if default:
+                    entry.insert(0, str(default))
+                self._validators[f"Fuel & Oxidiser_{var_name}"]()
+
+        if not frame.winfo_manager():
+            frame.pack(fill=tk.X, after=frame._anchor)
         self.validate_inputs()
 
     def create_fuel_fields(self, parent):
@@ -702,73 +906,55 @@ class HybridRocketGUI:
 
         self.fuel_dynamic_frame = tk.Frame(parent, bg=self.colors['bg_secondary'])
         self.fuel_dynamic_frame.pack(fill=tk.X)
+        self.fuel_dynamic_frame._anchor = self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"].master
+        self._fuel_dynamic_entries = {}
 
     def on_fuel_change(self):
-        for widget in self.fuel_dynamic_frame.winfo_children():
-            widget.destroy()
-
+        self._dropdown_changed("Fuel & Oxidiser_Fuel")
         fuel = self.dropdowns["Fuel & Oxidiser_Fuel"].get()
+        self._fuel_handlers.get(fuel, self.create_fuel_dynamic_fields)()
 
-        if fuel == "Select other options":
-            def callback(selected):
-                self.dropdowns["Fuel & Oxidiser_Fuel"].set(selected)
-                self.on_fuel_change()
+    def _search_fuel(self):
+        # Hidden only while the popup is pending, standard reactants keep it packed
+        self.fuel_dynamic_frame.pack_forget()
 
-            self.show_search_popup("Select Fuel", self.cea_reactants, callback)
-            return
+        def callback(selected):
+            self.dropdowns["Fuel & Oxidiser_Fuel"].set(selected)
+            self.on_fuel_change()
 
-        elif fuel == "Custom with exploded formula":
-            def callback(result):
-                self.inputs["Fuel & Oxidiser_Fuel_CustomName"] = result['name']
-                self.inputs["Fuel & Oxidiser_Fuel_ExpandedFormula"] = result['exploded_formula']
-                self.dropdowns["Fuel & Oxidiser_Fuel"].set(f"Custom: {result['name']}")
-                self.create_fuel_dynamic_fields(result['temperature'], result['enthalpy'])
+        self.show_search_popup("Select Fuel", self.cea_reactants, callback)
 
-            self.show_custom_formula_popup(callback)
-            return
+    def _custom_fuel(self):
+        self.fuel_dynamic_frame.pack_forget()
 
-        if fuel == "paraffin":
-            self.create_fuel_dynamic_fields(533.0, -1860.6)
-        else:
-            self.create_fuel_dynamic_fields()
+        def callback(result):
+            self.inputs["Fuel & Oxidiser_Fuel_CustomName"] = result['name']
+            self.inputs["Fuel & Oxidiser_Fuel_ExpandedFormula"] = result['exploded_formula']
+            self.dropdowns["Fuel & Oxidiser_Fuel"].set(f"Custom: {result['name']}")
+            self.create_fuel_dynamic_fields(result['temperature'], result['enthalpy'])
+
+        self.show_custom_formula_popup(callback)
 
     def create_fuel_dynamic_fields(self, temp_default=None, enthalpy_default=None):
-        self.create_modern_float_field(self.fuel_dynamic_frame, "Fuel & Oxidiser",
-                                       "Fuel_Temperature", "Fuel Temperature [K]",
-                                       default=temp_default)
-        self.create_modern_float_field(self.fuel_dynamic_frame, "Fuel & Oxidiser",
-                                       "Fuel_SpecificEnthalpy",
-                                       "Fuel Specific Enthalpy [kJ/mol]",
-                                       default=enthalpy_default)
-        self.validate_inputs()
+        self._show_dynamic_fields(self.fuel_dynamic_frame, self._fuel_dynamic_entries, (
+            ("Fuel_Temperature", "Fuel Temperature [K]", temp_default),
+            ("Fuel_SpecificEnthalpy", "Fuel Specific Enthalpy [kJ/mol]", enthalpy_default)))
 
-    def validate_fuel_weight_fraction(self):
+    def validate_fuel_weight_fraction(self, event=None):
         entry = self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"]
-        value = entry.get().strip()
+        value, _, cached_valid = _get_parsed(entry)
+        if event is not None and cached_valid is not None:
+            return
 
         is_valid = False
         if value:
-            try:
-                fractions = [float(x.strip()) for x in value.split(',')]
-                if all(f > 0 for f in fractions) and abs(sum(fractions) - 100) < 0.01:
-                    is_valid = True
-            except ValueError:
-                pass
-
-        if is_valid:
-            entry.configure(bg='#e8f5e9', highlightthickness=2,
-                            highlightbackground=self.colors['success'],
-                            highlightcolor=self.colors['success'])
-        elif value:
-            entry.configure(bg='#ffebee', highlightthickness=2,
-                            highlightbackground=self.colors['error'],
-                            highlightcolor=self.colors['error'])
-        else:
-            entry.configure(bg=self.colors['input_bg'], highlightthickness=1,
-                            highlightbackground=self.colors['border'],
-                            highlightcolor=self.colors['accent'])
+            fractions = _parse_fractions(value)
+            if fractions and all(f > 0 for f in fractions) and abs(sum(fractions) - 100) < 0.01:
+                is_valid = True
 
-        self.validate_inputs()
+        entry._cached_valid = is_valid
+        self._paint_validation(entry, value, is_valid)
+        self._set_field_valid("Fuel & Oxidiser_Fuel_WeightFraction", is_valid)
 
     def create_injector_section(self, parent):
         fields_frame = self.create_card(parent, "Injector")
@@ -795,58 +981,38 @@ class HybridRocketGUI:
                          fg=self.colors['text_secondary'])
         label.pack(anchor='w', pady=(0, 5))
 
-        entry = tk.Entry(row, font=('Segoe UI', 11), relief=tk.FLAT,
-                         bg=self.colors['input_bg'], bd=0,
-                         highlightthickness=1,
-                         highlightbackground=self.colors['border'],
-                         highlightcolor=self.colors['accent'])
-        entry.pack(fill=tk.X, ipady=8)
-        entry.bind('<KeyRelease>', lambda e: self.validate_epsilon())
+        entry = ttk.Entry(row, font=('Segoe UI', 11), style='Neutral.TEntry')
+        entry._style_state = 'neutral'
+        entry.pack(fill=tk.X, ipady=4)
+        entry.bind('<KeyRelease>', self._debounce(entry, self.validate_epsilon))
 
-        self.inputs["Nozzle_epsilon"] = entry
+        self._register_input("Nozzle_epsilon", entry, self.validate_epsilon)
 
-    def validate_epsilon(self):
+    def validate_epsilon(self, event=None):
         entry = self.inputs["Nozzle_epsilon"]
-        value = entry.get().strip()
+        value, float_val, cached_valid = _get_parsed(entry)
+        if event is not None and cached_valid is not None:
+            return
 
         is_valid = False
         if value:
             if value.lower() == "adapt":
                 is_valid = True
-            else:
-                try:
-                    if float(value) > 1:
-                        is_valid = True
-                except ValueError:
-                    pass
+            elif float_val is not None and float_val > 1:
+                is_valid = True
 
-        if is_valid:
-            entry.configure(bg='#e8f5e9', highlightthickness=2,
-                            highlightbackground=self.colors['success'],
-                            highlightcolor=self.colors['success'])
-        elif value:
-            entry.configure(bg='#ffebee', highlightthickness=2,
-                            highlightbackground=self.colors['error'],
-                            highlightcolor=self.colors['error'])
-        else:
-            entry.configure(bg=self.colors['input_bg'], highlightthickness=1,
-                            highlightbackground=self.colors['border'],
-                            highlightcolor=self.colors['accent'])
-
-        self.validate_inputs()
+        entry._cached_valid = is_valid
+        self._paint_validation(entry, value, is_valid)
+        self._set_field_valid("Nozzle_epsilon", is_valid)
 
     def create_modern_dropdown(self, parent, label_text, key, values, callback):
         row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         row.pack(fill=tk.X, pady=12)  # Increased vertical spacing
 
-        # Create a container for the label and dropdown
-        field_container = tk.Frame(row, bg=self.colors['bg_secondary'])
-        field_container.pack(fill=tk.X, padx=20)  # Add padding to create margins
-        
-        label = tk.Label(field_container, text=label_text, font=('Segoe UI', 10),
+        label = tk.Label(row, text=label_text, font=('Segoe UI', 10),
                          bg=self.colors['bg_secondary'],
                          fg=self.colors['text_secondary'])
-        label.pack(anchor='w', pady=(0, 5))
+        label.pack(anchor='w', padx=20, pady=(0, 5))
 
         if TTKBOOTSTRAP_AVAILABLE:
             combo = ttk.Combobox(row, font=('Segoe UI', 11),
@@ -855,166 +1021,118 @@ class HybridRocketGUI:
             combo = ttk.Combobox(row, font=('Segoe UI', 11),
                                  values=values, state='readonly')
         combo.pack(fill=tk.X, ipady=6)
-        combo.bind('<<ComboboxSelected>>', lambda e: callback())
+
+        def on_selected(event):
+            self._dropdown_changed(key)
+            callback()
+
+        combo.bind('<<ComboboxSelected>>', on_selected)
 
         self.dropdowns[key] = combo
+        self._unset_dropdowns.add(key)
+
+    def _dropdown_changed(self, key):
+        if self.dropdowns[key].get():
+            self._unset_dropdowns.discard(key)
+        else:
+            self._unset_dropdowns.add(key)
 
     def create_modern_float_field(self, parent, section, var_name, display_name,
                                   min_value=None, max_value=None, exclusive=False,
                                   default=None, validation_func=None):
         row = tk.Frame(parent, bg=self.colors['bg_secondary'])
         row.pack(fill=tk.X, pady=8)
-        
-        # Create a container for the input field with margins
-        field_container = tk.Frame(row, bg=self.colors['bg_secondary'])
-        field_container.pack(fill=tk.X, padx=20)
 
         label = tk.Label(row, text=display_name + ":", font=('Segoe UI', 10),
                          bg=self.colors['bg_secondary'],
                          fg=self.colors['text_secondary'])
         label.pack(anchor='w', pady=(0, 5))
 
-        entry = tk.Entry(row, font=('Segoe UI', 11), relief=tk.FLAT,
-                         bg=self.colors['input_bg'], bd=0,
-                         highlightthickness=1,
-                         highlightbackground=self.colors['border'],
-                         highlightcolor=self.colors['accent'])
-        entry.pack(fill=tk.X, ipady=8)
+        entry = ttk.Entry(row, font=('Segoe UI', 11), style='Neutral.TEntry')
+        entry._style_state = 'neutral'
+        entry.pack(fill=tk.X, ipady=4)
 
         if default:
             entry.insert(0, str(default))
 
-        entry.validation_params = {
-            'min_value': min_value,
-            'max_value': max_value,
-            'exclusive': exclusive
-        }
-
+        key = f"{section}_{var_name}"
         if validation_func:
-            entry.bind('<KeyRelease>', lambda e: validation_func())
+            validator = validation_func
+        else:
+            validator = _make_validator(entry, key, min_value, max_value, exclusive,
+                                        self._paint_validation, self._set_field_valid)
+        entry.bind('<KeyRelease>', self._debounce(entry, validator))
+
+        self._register_input(key, entry, validator)
+
+    def _register_input(self, key, entry, validator):
+        """Store an entry with its validator and seed its validity"""
+        old_entry = self.inputs.get(key)
+        if old_entry is not None and not isinstance(old_entry, str):
+            self._entry_to_key.pop(old_entry, None)
+        self.inputs[key] = entry
+        self._entry_to_key[entry] = key
+        self._validators[key] = validator
+
+        if entry.get().strip():
+            validator()
         else:
-            entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+            self._invalid.add(key)
 
-        self.inputs[f"{section}_{var_name}"] = entry
+    def _debounce(self, entry, validator):
+        """Wrap a validator so a burst of key releases only validates once"""
+        def on_key_release(event):
+            if entry._pending_after_id is not None:
+                self.root.after_cancel(entry._pending_after_id)
+            entry._pending_after_id = self.root.after(30, run, event)
 
-    def validate_single_input(self, entry):
-        value = entry.get().strip()
-        is_valid = False
+        def run(event):
+            entry._pending_after_id = None
+            if entry.winfo_exists():
+                validator(event)
 
-        if value:
-            field_key = None
-            for key, val in self.inputs.items():
-                if val == entry:
-                    field_key = key
-                    break
-
-            if field_key and ("CustomName" in field_key or "ExpandedFormula" in field_key):
-                is_valid = len(value) > 0
-            else:
-                try:
-                    float_val = float(value)
-                    is_valid = True
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val > params['min_value']
-                            else:
-                                is_valid = is_valid and float_val >= params['min_value']
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val < params['max_value']
-                            else:
-                                is_valid = is_valid and float_val <= params['max_value']
-                except ValueError:
-                    is_valid = False
+        entry._pending_after_id = None
+        return on_key_release
 
+    def _set_field_valid(self, key, is_valid):
         if is_valid:
-            entry.configure(bg='#e8f5e9', highlightthickness=2,
-                            highlightbackground=self.colors['success'],
-                            highlightcolor=self.colors['success'])
-        elif value:
-            entry.configure(bg='#ffebee', highlightthickness=2,
-                            highlightbackground=self.colors['error'],
-                            highlightcolor=self.colors['error'])
+            self._invalid.discard(key)
         else:
-            entry.configure(bg=self.colors['input_bg'], highlightthickness=1,
-                            highlightbackground=self.colors['border'],
-                            highlightcolor=self.colors['accent'])
+            self._invalid.add(key)
+        self._schedule_validate_inputs()
 
-        self.validate_inputs()
-
-    def validate_inputs(self):
-        all_valid = True
+    def _schedule_validate_inputs(self):
+        """Collapse the form-level validation requested by several fields into one"""
+        if self._pending_global is None:
+            self._pending_global = self.root.after(50, self._do_validate_inputs)
 
-        for key, entry in self.inputs.items():
-            if isinstance(entry, str):
-                continue
+    def _do_validate_inputs(self):
+        self._pending_global = None
+        self.validate_inputs()
 
-            value = entry.get().strip()
-            if not value:
-                all_valid = False
-                continue
+    def _revalidate_all(self):
+        """Run every field validator, e.g. after values were loaded from a file"""
+        for key, validator in list(self._validators.items()):
+            if self.inputs[key].winfo_exists():
+                validator()
 
-            if "CustomName" in key or "ExpandedFormula" in key:
-                if not value:
-                    all_valid = False
-            else:
-                try:
-                    float_val = float(value)
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val > params['min_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val >= params['min_value']):
-                                    all_valid = False
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val < params['max_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val <= params['max_value']):
-                                    all_valid = False
-                except ValueError:
-                    all_valid = False
-
-        if "Nozzle_epsilon" in self.inputs:
-            eps_value = self.inputs["Nozzle_epsilon"].get().strip()
-            if eps_value:
-                if eps_value.lower() != "adapt":
-                    try:
-                        if float(eps_value) <= 1:
-                            all_valid = False
-                    except ValueError:
-                        all_valid = False
-            else:
-                all_valid = False
+    def _paint_validation(self, entry, value, is_valid):
+        if is_valid:
+            state = 'valid'
+        elif value:
+            state = 'invalid'
+        else:
+            state = 'neutral'
 
-        if "Fuel & Oxidiser_Fuel_WeightFraction" in self.inputs:
-            value = self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"].get().strip()
-            if value:
-                try:
-                    fractions = [float(x.strip()) for x in value.split(',')]
-                    if not (all(f > 0 for f in fractions) and abs(sum(fractions) - 100) < 0.01):
-                        all_valid = False
-                except ValueError:
-                    all_valid = False
-            else:
-                all_valid = False
+        if getattr(entry, '_style_state', None) != state:
+            entry.configure(style=self._STYLE_NAMES[state])
+            entry._style_state = state
 
-        for key, combo in self.dropdowns.items():
-            if not combo.get():
-                all_valid = False
+    def validate_inputs(self):
+        all_valid = not self._invalid and not self._unset_dropdowns and not self._pending_sections
+        self._update_save_button(all_valid)
 
+    def _update_save_button(self, all_valid):
         # Update save button
         if hasattr(self, 'save_btn'):
             if TTKBOOTSTRAP_AVAILABLE:
@@ -1032,6 +1150,7 @@ class HybridRocketGUI:
         messagebox.showinfo("Info", "Import line function in development")
 
     def validate_and_save(self):
+        self._realize_all_sections()
         config = {}
         all_valid = True
 
@@ -1040,22 +1159,18 @@ class HybridRocketGUI:
                 config[key] = entry
                 continue
 
-            value = entry.get().strip()
+            value, float_val, _ = _get_parsed(entry)
             if not value:
                 all_valid = False
                 break
 
-            if "CustomName" in key or "ExpandedFormula" in key:
+            if float_val is not None:
+                config[key] = float_val
+            elif key == "Nozzle_epsilon" and value.lower() == "adapt":
                 config[key] = value
             else:
-                try:
-                    config[key] = float(value)
-                except ValueError:
-                    if key == "Nozzle_epsilon" and value.lower() == "adapt":
-                        config[key] = value
-                    else:
-                        all_valid = False
-                        break
+                all_valid = False
+                break
 
         for key, combo in self.dropdowns.items():
             value = combo.get()
@@ -1085,6 +1200,7 @@ class HybridRocketGUI:
             self._save_to_file(filename)
 
     def _save_to_file(self, filename):
+        self._realize_all_sections()
         config = {}
 
         for key, entry in self.inputs.items():
@@ -1092,25 +1208,60 @@ class HybridRocketGUI:
                 config[key] = entry
                 continue
 
-            value = entry.get().strip()
+            value, float_val, _ = _get_parsed(entry)
             if value:
-                if "CustomName" in key or "ExpandedFormula" in key:
-                    config[key] = value
-                else:
-                    try:
-                        config[key] = float(value)
-                    except ValueError:
-                        config[key] = value
+                config[key] = value if float_val is None else float_val
 
         for key, combo in self.dropdowns.items():
             value = combo.get()
             if value:
                 config[key] = value
 
-        with open(filename, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Widgets are only read above; encoding and writing run off the UI thread
+        self._save_queue.put((filename, config))
 
-        messagebox.showinfo("Saved", f"Configuration saved to:\n{filename}")
+    def _save_worker(self):
+        """Write queued configurations one at a time, in the order they were saved"""
+        while True:
+            filename, config = self._save_queue.get()
+            try:
+                self._save_results.put(self._write_json(filename, config))
+            finally:
+                self._save_queue.task_done()
+
+    def _drain_save_results(self):
+        """Show the outcome of finished saves; the writer thread never touches Tk"""
+        try:
+            while True:
+                ok, message = self._save_results.get_nowait()
+                if ok:
+                    messagebox.showinfo("Saved", message)
+                else:
+                    messagebox.showerror("Error", message)
+        except queue.Empty:
+            pass
+
+        self.root.after(100, self._drain_save_results)
+
+    def _on_close(self):
+        # Let pending saves finish so no file is left half written
+        if self._save_queue.unfinished_tasks:
+            self.root.after(50, self._on_close)
+            return
+        self.root.destroy()
+
+    def _write_json(self, filename, config):
+        """Write config to filename and return (ok, message) for the user"""
+        tmp_filename = filename + ".tmp"
+        try:
+            # Write beside the target and swap it in, so the file is never partial
+            with open(tmp_filename, 'w') as f:
+                json.dump(config, f, indent=4)
+            os.replace(tmp_filename, filename)
+        except Exception as e:
+            return False, f"Error saving configuration:\n{str(e)}"
+
+        return True, f"Configuration saved to:\n{filename}"
 
     def open_config(self):
         filename = filedialog.askopenfilename(
@@ -1121,6 +1272,8 @@ class HybridRocketGUI:
                 with open(filename, 'r') as f:
                     config = json.load(f)
 
+                self._realize_all_sections()
+
                 for key, value in config.items():
                     if key in self.inputs:
                         if isinstance(self.inputs[key], str):
@@ -1137,6 +1290,7 @@ class HybridRocketGUI:
                     self.on_fuel_change()
 
                 self.current_file = filename
+                self._revalidate_all()
                 self.validate_inputs()
                 messagebox.showinfo("Loaded", f"Configuration loaded from:\n{filename}")
             except Exception as e:
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import functools
 import json
 import os
 import re
@@ -13,8 +14,69 @@ except ImportError:
     COOLPROP_AVAILABLE = False
     print("Warning: CoolProp not available. Using fallback oxidizer list.")
 
+# Shared options for the label/entry rows of the configuration cards
+_LABEL_OPTS = {'font': ('Arial', 11), 'fg': 'black', 'width': 25, 'anchor': 'w'}
+_ENTRY_OPTS = {'font': ('Arial', 11), 'width': 30, 'relief': tk.SUNKEN, 'bd': 2,
+               'highlightthickness': 2}
+
+# Compact separators keep the C encoder path (it is skipped when indenting)
+_CONFIG_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+@functools.lru_cache(maxsize=1024)
+def _try_float(text):
+    """Return (ok, value) for text; the regex keeps half-typed numbers off the exception path"""
+    if _FLOAT_RE.fullmatch(text):
+        return True, float(text)
+    return False, 0.0
+
+
+def _fractions_valid(value):
+    """True if value is comma-separated positive fractions summing to 100"""
+    if not value:
+        return False
+    # One pass: bail on the first unparsable or non-positive fraction
+    total = 0.0
+    for part in value.split(','):
+        try:
+            fraction = float(part)
+        except ValueError:
+            return False
+        if fraction <= 0:
+            return False
+        total += fraction
+    return abs(total - 100) < 0.01
+
+
+_COOLPROP_FLUIDS_CACHE = None  # FluidsList() is only queried once per process
+
 
 class HybridRocketGUI:
+    _FORMULA_RE = re.compile(r'([A-Z][a-z]?)(\d*)')
+    _VALID_FORMULA_RE = re.compile(r'(?:[A-Z][a-z]?\d*)+')
+    _CEA_CACHE = None  # (sorted reactants, lowercased reactants)
+
+    # Keys whose values are free text rather than numbers
+    _STRING_KEYS = frozenset({
+        "Fuel & Oxidiser_Oxidizer_CustomName", "Fuel & Oxidiser_Oxidizer_ExpandedFormula",
+        "Fuel & Oxidiser_Fuel_CustomName", "Fuel & Oxidiser_Fuel_ExpandedFormula",
+    })
+
+    # Entries validate on Enter/focus-out; set True to also validate while typing
+    VALIDATE_ON_KEYSTROKE = False
+
+    # Easy access lists for common oxidizers and fuels
+    SELECT_OTHER = "Select other options"
+    CUSTOM_FORMULA = "Custom with exploded formula"
+    easy_cea_ox_list = ("Air", "CL2", "CL2(L)", "F2", "F2(L)", "H2O2(L)",
+                        "N2H4(L)", "N2O", "NH4NO3(I)", "O2", "O2(L)",
+                        SELECT_OTHER, CUSTOM_FORMULA)
+    easy_cea_fuel_list = ("CH4", "CH4(L)", "H2", "H2(L)", "RP-1", "paraffin",
+                          SELECT_OTHER, CUSTOM_FORMULA)
+
     def __init__(self, root):
         self.root = root
         self.root.title("hybrid model")
@@ -35,96 +97,98 @@ class HybridRocketGUI:
         self.button_active = '#6c6c6c'
 
         # Variables for inputs
-        self.inputs = {}
+        self.inputs = {}  # Entry widgets only
+        self.stored_strings = {}  # Values without a widget, e.g. custom reactant names
         self.dropdowns = {}
+        self._dropdown_values = {}  # Last known selection per dropdown
         self.current_page = 'configuration'
 
+        # Last validation result per entry key, and how many are currently invalid
+        self._validity = {}
+        self._invalid_count = 0
+        self._last_button_color = None
+        self._suppress_validation = False  # Set while a config is being loaded
+
         # Load reactant lists
         self.load_reactant_lists()
 
-        # Define custom styles
+        # Define custom styles (ttk styles are shared by every window on this interpreter)
         self.style = ttk.Style()
-        self.style.configure("Rounded.TButton",
-                             font=('Arial', 11),
-                             padding=6,
-                             relief="flat",
-                             borderwidth=0,
-                             background=self.button_inactive,
-                             foreground='black')
-        self.style.map("Rounded.TButton",
-                       background=[('active', self.button_active), ('!active', self.button_inactive)],
-                       foreground=[('active', 'white'), ('!active', 'black')])
+        if not self.style.configure("Rounded.TButton"):
+            self.style.configure("Rounded.TButton",
+                                 font=('Arial', 11),
+                                 padding=6,
+                                 relief="flat",
+                                 borderwidth=0,
+                                 background=self.button_inactive,
+                                 foreground='black')
+            self.style.map("Rounded.TButton",
+                           background=[('active', self.button_active), ('!active', self.button_inactive)],
+                           foreground=[('active', 'white'), ('!active', 'black')])
+            self.style.configure("Active.Rounded.TButton", background=self.button_active)
+            self.style.map("Active.Rounded.TButton",
+                           background=[('active', self.button_active), ('!active', self.button_active)],
+                           foreground=[('active', 'white'), ('!active', 'white')])
 
         # Menu and navigation
         self.create_header()
         self.create_sidebar()
 
+        # Validation handlers are registered once for every configuration entry
+        self.root.bind_class("ConfigEntry", "<KeyRelease>", self._on_keyrelease)
+        self.root.bind_class("ConfigEntry", "<FocusOut>", self._on_entry_commit)
+        self.root.bind_class("ConfigEntry", "<Return>", self._on_entry_commit)
+
+        # Wheel scrolling targets whichever page canvas is current
+        self._active_canvas = None
+        self.root.bind_all("<MouseWheel>", self._on_mousewheel)
+
         # Content area
         self.content_frame = tk.Frame(self.root, bg=self.bg_dark)
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=20)
 
+        # Pages are built on first visit, then only hidden/shown
+        self._page_frames = {}
+        self._page_canvases = {}
+
         # Show configuration page
-        self.show_configuration_page()
+        self.change_page('configuration')
 
     def load_reactant_lists(self):
         """Load reactant lists from CEA_reactants.txt and CoolProp"""
-        # Load CEA reactants from file
-        self.cea_reactants = []
-        try:
-            with open("CEA_reactants.txt", "r", encoding="utf-8") as f:
-                self.cea_reactants = [line.strip() for line in f.readlines() if line.strip()]
-            self.cea_reactants.sort()
-        except FileNotFoundError:
-            messagebox.showwarning("Warning", "CEA_reactants.txt not found. Using empty reactant list.")
-            self.cea_reactants = []
-
-        # Easy access lists for common oxidizers and fuels
-        self.easy_cea_ox_list = ["Air", "CL2", "CL2(L)", "F2", "F2(L)", "H2O2(L)",
-                                 "N2H4(L)", "N2O", "NH4NO3(I)", "O2", "O2(L)",
-                                 "Select other options", "Custom with exploded formula"]
-
-        self.easy_cea_fuel_list = ["CH4", "CH4(L)", "H2", "H2(L)", "RP-1", "paraffin",
-                                   "Select other options", "Custom with exploded formula"]
+        # Load CEA reactants from file (parsed once per process)
+        cache = HybridRocketGUI._CEA_CACHE
+        if cache is None:
+            try:
+                with open("CEA_reactants.txt", "rb", buffering=65536) as f:
+                    data = f.read().decode("utf-8")
+                reactants = [name for line in data.splitlines() if (name := line.strip())]
+                reactants.sort()
+                reactants = tuple(reactants)
+                cache = HybridRocketGUI._CEA_CACHE = (reactants, tuple(name.lower() for name in reactants))
+            except FileNotFoundError:
+                messagebox.showwarning("Warning", "CEA_reactants.txt not found. Using empty reactant list.")
+                cache = ((), ())
+        self.cea_reactants, self.cea_reactants_lower = cache
 
         # CoolProp fluids list
-        if COOLPROP_AVAILABLE:
-            self.coolprop_fluids = cp.FluidsList()
-        else:
-            # Fallback list of common fluids
-            self.coolprop_fluids = ["NitrousOxide", "Oxygen", "Nitrogen", "Water",
-                                    "CarbonDioxide", "Methane", "Hydrogen"]
+        global _COOLPROP_FLUIDS_CACHE
+        if _COOLPROP_FLUIDS_CACHE is None:
+            if COOLPROP_AVAILABLE:
+                _COOLPROP_FLUIDS_CACHE = tuple(cp.FluidsList())
+            else:
+                # Fallback list of common fluids
+                _COOLPROP_FLUIDS_CACHE = ("NitrousOxide", "Oxygen", "Nitrogen", "Water",
+                                          "CarbonDioxide", "Methane", "Hydrogen")
+        self.coolprop_fluids = _COOLPROP_FLUIDS_CACHE
 
     def explode_formula(self, formula):
         """Convert chemical formula to expanded format (e.g., H2O2 -> H 2 O 2)"""
-        formula = formula.replace(" ", "")
-        exploded_formula = ""
-        prec = "1"
-
-        for i, char in enumerate(formula):
-            if char.isupper() and char.isalpha():
-                if prec.isdigit():
-                    exploded_formula = exploded_formula + " " + char
-                else:
-                    exploded_formula = exploded_formula + " " + "1" + " " + char
-                prec = char
-
-            elif char.islower() and char.isalpha():
-                if prec.isupper() and prec.isalpha():
-                    exploded_formula = exploded_formula + char
-                prec = char
-
-            elif char.isdigit():
-                if prec.isalpha():
-                    exploded_formula = exploded_formula + " " + char
-                elif prec.isdigit():
-                    exploded_formula = exploded_formula + char
-                prec = char
-
-            if i == (len(formula) - 1) and char.isalpha():
-                exploded_formula = exploded_formula + " " + "1"
-
-        exploded_formula = exploded_formula.strip()
-        return exploded_formula
+        parts = []
+        for element, count in self._FORMULA_RE.findall(formula.replace(" ", "")):
+            parts.append(element)
+            parts.append(count or "1")
+        return " ".join(parts)
 
     def show_search_popup(self, title, reactant_list, callback):
         """Show popup window with search functionality for reactant selection"""
@@ -139,6 +203,10 @@ class HybridRocketGUI:
         # Bind the popup destruction to update the tracking state
         def on_popup_close():
             self.search_popup_active = False
+            # Release the trace's Tcl command, which otherwise outlives the popup
+            search_var.trace_remove('write', search_trace_id)
+            if search_after_id is not None:
+                popup.after_cancel(search_after_id)
             popup.destroy()
         popup.protocol("WM_DELETE_WINDOW", on_popup_close)
 
@@ -166,16 +234,45 @@ class HybridRocketGUI:
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=listbox.yview)
 
+        # Lowercase once so filtering doesn't re-lower every item per keystroke
+        if reactant_list is self.cea_reactants:
+            lowered = self.cea_reactants_lower
+        else:
+            lowered = [item.lower() for item in reactant_list]
+
         # Populate listbox
+        shown = None
+
         def update_listbox(*args):
+            nonlocal search_after_id, shown
+            search_after_id = None
+            if not listbox.winfo_exists():
+                return
             search_term = search_var.get().lower()
+
+            if not search_term:
+                filtered = reactant_list
+            else:
+                filtered = [reactant_list[i] for i, item in enumerate(lowered) if search_term in item]
+            # Leave the listbox alone if the matches didn't change
+            if shown is not None and list(filtered) == list(shown):
+                return
+            shown = filtered
+
             listbox.delete(0, tk.END)
+            if filtered:
+                listbox.insert(tk.END, *filtered)
+
+        # Coalesce keystrokes so only the last one within 120 ms refilters
+        search_after_id = None
 
-            filtered = [item for item in reactant_list if search_term in item.lower()]
-            for item in filtered:
-                listbox.insert(tk.END, item)
+        def on_search_change(*args):
+            nonlocal search_after_id
+            if search_after_id is not None:
+                popup.after_cancel(search_after_id)
+            search_after_id = popup.after(120, update_listbox)
 
-        search_var.trace('w', update_listbox)
+        search_trace_id = search_var.trace_add('write', on_search_change)
         update_listbox()
 
         # Select button
@@ -183,9 +280,9 @@ class HybridRocketGUI:
             selection = listbox.curselection()
             if selection:
                 selected_item = listbox.get(selection[0])
-                self.search_popup_active = False
+                # Close first so the callback's validation isn't skipped
+                on_popup_close()
                 callback(selected_item)
-                popup.destroy()
             else:
                 messagebox.showwarning("No Selection", "Please select an item.")        
         select_btn = ttk.Button(popup, text="Select", style="Rounded.TButton", command=on_select)
@@ -254,6 +351,9 @@ class HybridRocketGUI:
             if not formula:
                 error_label.config(text="Please enter a formula")
                 return
+            if not self._VALID_FORMULA_RE.fullmatch(formula.replace(" ", "")):
+                error_label.config(text="Invalid formula format")
+                return
 
             try:
                 temp_val = float(temp) if temp else None
@@ -328,8 +428,12 @@ class HybridRocketGUI:
             self.dropdown_frame.destroy()
             self.dropdown_frame = None
         else:
-            x = self.menu_button.winfo_rootx() + self.menu_button.winfo_width()
-            y = self.menu_button.winfo_rooty() + self.menu_button.winfo_height()  # Position below the button
+            # Query the button geometry once
+            mb = self.menu_button
+            mb_w = mb.winfo_width()
+            mb_h = mb.winfo_height()
+            x = mb.winfo_rootx() + mb_w
+            y = mb.winfo_rooty() + mb_h  # Position below the button
             
             # Create dropdown frame
             self.dropdown_frame = tk.Toplevel(self.root)
@@ -359,58 +463,51 @@ class HybridRocketGUI:
             
             # Now position the frame above the button
             frame_height = self.dropdown_frame.winfo_height()
-            frame_y = y - frame_height - self.menu_button.winfo_height()  # Position above the button
+            frame_y = y - frame_height - mb_h  # Position above the button
             
             self.dropdown_frame.geometry(f"150x{frame_height}+{x}+{frame_y}")
 
-            tk.Button(self.dropdown_frame, text="Save", font=('Arial', 10),
-                      bg=self.bg_light, command=self.save_config,
-                      relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0).pack(fill=tk.X, pady=2, padx=2)
-            tk.Button(self.dropdown_frame, text="Save As", font=('Arial', 10),
-                      bg=self.bg_light, command=self.save_config_as,
-                      relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0).pack(fill=tk.X, pady=2, padx=2)
-            tk.Button(self.dropdown_frame, text="Open", font=('Arial', 10),
-                      bg=self.bg_light, command=self.open_config,
-                      relief=tk.FLAT, anchor='w', highlightthickness=0, bd=0).pack(fill=tk.X, pady=2, padx=2)
-
             self.dropdown_frame.bind("<FocusOut>", lambda e: self.toggle_menu())
             self.root.bind("<Button-1>", self.close_dropdown_on_click)
 
     def change_page(self, page):
         for p, btn in self.page_buttons.items():
-            if p == page:
-                self.style.configure("Rounded.TButton", background=self.button_active)
-            else:
-                self.style.configure("Rounded.TButton", background=self.button_inactive)
+            btn.configure(style="Active.Rounded.TButton" if p == page else "Rounded.TButton")
+
+        previous = self._page_frames.get(self.current_page)
+        if previous is not None:
+            previous.pack_forget()
 
         self.current_page = page
 
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        frame = self._page_frames.get(page)
+        if frame is None:
+            frame = tk.Frame(self.content_frame, bg=self.bg_dark)
+            self._page_frames[page] = frame
+            if page == 'configuration':
+                self.show_configuration_page(frame)
+            else:
+                label = tk.Label(frame, text=f"{page.upper()} - Coming soon",
+                                 font=('Arial', 20), bg=self.bg_dark, fg=self.text_color)
+                label.pack(expand=True)
+        frame.pack(fill=tk.BOTH, expand=True)
 
-        if page == 'configuration':
-            self.show_configuration_page()
-        else:
-            label = tk.Label(self.content_frame, text=f"{page.upper()} - Coming soon",
-                             font=('Arial', 20), bg=self.bg_dark, fg=self.text_color)
-            label.pack(expand=True)
+        self._active_canvas = self._page_canvases.get(page)
 
-    def show_configuration_page(self):
-        canvas = tk.Canvas(self.content_frame, bg=self.bg_dark, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+    def show_configuration_page(self, parent):
+        canvas = tk.Canvas(parent, bg=self.bg_dark, highlightthickness=0)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.bg_dark)
 
+        canvas._bbox_after_id = None
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: self._schedule_bbox_update(canvas)
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
         title = tk.Label(scrollable_frame, text="configuration",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
         title.pack(pady=(0, 20))
@@ -428,30 +525,40 @@ class HybridRocketGUI:
                               command=self.validate_and_save)
         save_btn.pack(pady=10)
 
+        # Pack the canvas only once its content exists, so the layout is computed in one pass
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
         self.validate_inputs()
 
-        def _on_mousewheel(event):
-            # Check if a combobox dropdown or search popup is active
-            if hasattr(self, 'search_popup_active') and self.search_popup_active:
-                # Don't scroll the main canvas when search popup is open
-                return
+        self._page_canvases['configuration'] = canvas
+
+    def _schedule_bbox_update(self, canvas):
+        """Coalesce scrollable frame <Configure> events into one scrollregion update"""
+        if canvas._bbox_after_id is None:
+            canvas._bbox_after_id = self.root.after(16, self._update_bbox, canvas)
+
+    def _update_bbox(self, canvas):
+        canvas._bbox_after_id = None
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def _on_mousewheel(self, event):
+        if self._active_canvas is None:
+            return
 
-            # Get the widget that triggered the event
-            widget = event.widget
-            while widget is not None:
-                # Check if we're in a Combobox dropdown
-                if isinstance(widget, tk.Listbox):
-                    parent = widget.master
-                    if parent and parent.master and parent.master.winfo_class() == 'TCombobox':
-                        # We're in a Combobox listbox, let it handle its own scrolling
-                        return
-                # Move up the widget hierarchy
-                widget = widget.master
+        # Check if a combobox dropdown or search popup is active
+        if self.search_popup_active:
+            # Don't scroll the main canvas when search popup is open
+            return
 
-            # If we're not in a Combobox dropdown or search popup, scroll the main canvas
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # Combobox dropdowns are Tk-internal, so tkinter reports them by path name
+        widget = event.widget
+        if isinstance(widget, str):
+            return
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # If we're not in a Combobox dropdown or search popup, scroll the main canvas
+        self._active_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
     def create_line_section(self, parent):
         section = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
@@ -515,17 +622,15 @@ class HybridRocketGUI:
         row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Weight fraction:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
+        tk.Label(row, text="Weight fraction:", bg=self.bg_light, **_LABEL_OPTS).pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light, state='readonly')
-        entry.insert(0, "100")
+        var = tk.StringVar(row, value="100")
+        entry = tk.Entry(row, textvariable=var, state='readonly', highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
+        entry.var = var
         entry.pack(side=tk.LEFT)
 
-        self.inputs["Fuel & Oxidiser_Oxidizer_WeightFraction"] = entry
+        self._register_entry("Fuel & Oxidiser_Oxidizer_WeightFraction", entry, is_valid=True)
 
         # Container for dynamic fields
         self.oxidizer_dynamic_frame = tk.Frame(parent, bg=self.bg_light)
@@ -534,25 +639,28 @@ class HybridRocketGUI:
     def on_oxidizer_change(self):
         for widget in self.oxidizer_dynamic_frame.winfo_children():
             widget.destroy()
+        self._set_validity("Fuel & Oxidiser_Oxidizer_Temperature", False)
+        self._set_validity("Fuel & Oxidiser_Oxidizer_SpecificEnthalpy", False)
 
         oxidizer = self.dropdowns["Fuel & Oxidiser_Oxidizer"].get()
+        self._dropdown_values["Fuel & Oxidiser_Oxidizer"] = oxidizer
 
-        if oxidizer == "Select other options":
+        if oxidizer == self.SELECT_OTHER:
             def callback(selected):
-                self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(selected)
+                self._set_dropdown("Fuel & Oxidiser_Oxidizer", selected)
                 self.on_oxidizer_change()
 
             self.show_search_popup("Select Oxidizer", self.cea_reactants, callback)
             return
 
-        elif oxidizer == "Custom with exploded formula":
+        elif oxidizer == self.CUSTOM_FORMULA:
             def callback(result):
                 # Store custom oxidizer data
-                self.inputs["Fuel & Oxidiser_Oxidizer_CustomName"] = result['name']
-                self.inputs["Fuel & Oxidiser_Oxidizer_ExpandedFormula"] = result['exploded_formula']
+                self.stored_strings["Fuel & Oxidiser_Oxidizer_CustomName"] = result['name']
+                self.stored_strings["Fuel & Oxidiser_Oxidizer_ExpandedFormula"] = result['exploded_formula']
 
                 # Update display
-                self.dropdowns["Fuel & Oxidiser_Oxidizer"].set(f"Custom: {result['name']}")
+                self._set_dropdown("Fuel & Oxidiser_Oxidizer", f"Custom: {result['name']}")
 
                 # Create dynamic fields with pre-filled values
                 self.create_oxidizer_dynamic_fields(result['temperature'], result['enthalpy'])
@@ -565,43 +673,32 @@ class HybridRocketGUI:
 
     def create_oxidizer_dynamic_fields(self, temp_default=None, enthalpy_default=None):
         """Create temperature and enthalpy fields for oxidizer"""
-        # Temperature field
-        row = tk.Frame(self.oxidizer_dynamic_frame, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text="Temperature [K]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-        if temp_default:
-            entry.insert(0, str(temp_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        self._make_labeled_entry(self.oxidizer_dynamic_frame, "Temperature [K]:",
+                                 "Fuel & Oxidiser_Oxidizer_Temperature", temp_default)
+        self._make_labeled_entry(self.oxidizer_dynamic_frame, "Specific Enthalpy [kJ/mol]:",
+                                 "Fuel & Oxidiser_Oxidizer_SpecificEnthalpy", enthalpy_default)
 
-        self.inputs["Fuel & Oxidiser_Oxidizer_Temperature"] = entry
+        self.validate_inputs()
 
-        # Specific Enthalpy field
-        row = tk.Frame(self.oxidizer_dynamic_frame, bg=self.bg_light)
+    def _make_labeled_entry(self, parent, text, key, default=None):
+        """Create a labelled, self-validating entry row and register it under key"""
+        row = tk.Frame(parent, bg=self.bg_light)
         row.pack(fill=tk.X, pady=5)
 
-        label = tk.Label(row, text="Specific Enthalpy [kJ/mol]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
+        tk.Label(row, text=text, bg=self.bg_light, **_LABEL_OPTS).pack(side=tk.LEFT, padx=(0, 10))
 
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
+        # Values are read and seeded through the variable; kept on the entry so it isn't collected
+        var = tk.StringVar(row, value="" if default is None else str(default))
+        entry = tk.Entry(row, textvariable=var, highlightbackground=self.bg_light,
+                         highlightcolor=self.bg_light, **_ENTRY_OPTS)
+        entry.var = var
         entry.pack(side=tk.LEFT)
-        if enthalpy_default:
-            entry.insert(0, str(enthalpy_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
+        entry.bindtags(("ConfigEntry",) + entry.bindtags())
 
-        self.inputs["Fuel & Oxidiser_Oxidizer_SpecificEnthalpy"] = entry
-
-        self.validate_inputs()
+        self._register_entry(key, entry)
+        if default is not None:
+            self._revalidate_entry(key)
+        return entry
 
     def create_fuel_fields(self, parent):
         # Main fuel dropdown
@@ -620,20 +717,7 @@ class HybridRocketGUI:
         self.dropdowns["Fuel & Oxidiser_Fuel"] = combo
 
         # Weight fraction
-        row = tk.Frame(parent, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text="Fuel Weight fraction:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-        entry.bind('<KeyRelease>', lambda e: self.validate_fuel_weight_fraction())
-
-        self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"] = entry
+        self._make_labeled_entry(parent, "Fuel Weight fraction:", "Fuel & Oxidiser_Fuel_WeightFraction")
 
         # Container for dynamic fuel fields
         self.fuel_dynamic_frame = tk.Frame(parent, bg=self.bg_light)
@@ -642,23 +726,26 @@ class HybridRocketGUI:
     def on_fuel_change(self):
         for widget in self.fuel_dynamic_frame.winfo_children():
             widget.destroy()
+        self._set_validity("Fuel & Oxidiser_Fuel_Temperature", False)
+        self._set_validity("Fuel & Oxidiser_Fuel_SpecificEnthalpy", False)
 
         fuel = self.dropdowns["Fuel & Oxidiser_Fuel"].get()
+        self._dropdown_values["Fuel & Oxidiser_Fuel"] = fuel
 
-        if fuel == "Select other options":
+        if fuel == self.SELECT_OTHER:
             def callback(selected):
-                self.dropdowns["Fuel & Oxidiser_Fuel"].set(selected)
+                self._set_dropdown("Fuel & Oxidiser_Fuel", selected)
                 self.on_fuel_change()
 
             self.show_search_popup("Select Fuel", self.cea_reactants, callback)
             return
 
-        elif fuel == "Custom with exploded formula":
+        elif fuel == self.CUSTOM_FORMULA:
             def callback(result):
-                self.inputs["Fuel & Oxidiser_Fuel_CustomName"] = result['name']
-                self.inputs["Fuel & Oxidiser_Fuel_ExpandedFormula"] = result['exploded_formula']
+                self.stored_strings["Fuel & Oxidiser_Fuel_CustomName"] = result['name']
+                self.stored_strings["Fuel & Oxidiser_Fuel_ExpandedFormula"] = result['exploded_formula']
 
-                self.dropdowns["Fuel & Oxidiser_Fuel"].set(f"Custom: {result['name']}")
+                self._set_dropdown("Fuel & Oxidiser_Fuel", f"Custom: {result['name']}")
 
                 self.create_fuel_dynamic_fields(result['temperature'], result['enthalpy'])
 
@@ -673,62 +760,28 @@ class HybridRocketGUI:
 
     def create_fuel_dynamic_fields(self, temp_default=None, enthalpy_default=None):
         """Create temperature and enthalpy fields for fuel"""
-        # Temperature field
-        row = tk.Frame(self.fuel_dynamic_frame, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text="Fuel Temperature [K]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-        if temp_default:
-            entry.insert(0, str(temp_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
-
-        self.inputs["Fuel & Oxidiser_Fuel_Temperature"] = entry
-
-        # Specific Enthalpy field
-        row = tk.Frame(self.fuel_dynamic_frame, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text="Fuel Specific Enthalpy [kJ/mol]:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-        if enthalpy_default:
-            entry.insert(0, str(enthalpy_default))
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
-
-        self.inputs["Fuel & Oxidiser_Fuel_SpecificEnthalpy"] = entry
+        self._make_labeled_entry(self.fuel_dynamic_frame, "Fuel Temperature [K]:",
+                                 "Fuel & Oxidiser_Fuel_Temperature", temp_default)
+        self._make_labeled_entry(self.fuel_dynamic_frame, "Fuel Specific Enthalpy [kJ/mol]:",
+                                 "Fuel & Oxidiser_Fuel_SpecificEnthalpy", enthalpy_default)
 
         self.validate_inputs()
 
     def validate_fuel_weight_fraction(self):
         entry = self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"]
-        value = entry.get().strip()
-
-        is_valid = False
-        if value:
-            try:
-                fractions = [float(x.strip()) for x in value.split(',')]
-                if all(f > 0 for f in fractions) and abs(sum(fractions) - 100) < 0.01:
-                    is_valid = True
-            except ValueError:
-                pass
+        value = entry.var.get().strip()
 
-        if is_valid:
-            entry.configure(highlightbackground='#00aa00', highlightcolor='#00aa00')
+        # Only reparse when the text actually changed since the last check
+        cached = getattr(entry, '_parsed_cache', None)
+        if cached is not None and cached[0] == value:
+            is_valid = cached[1]
         else:
-            entry.configure(highlightbackground='red', highlightcolor='red')
+            is_valid = _fractions_valid(value)
+            entry._parsed_cache = (value, is_valid)
+
+        self._paint_entry(entry, '#00aa00' if is_valid else 'red')
 
+        self._set_validity("Fuel & Oxidiser_Fuel_WeightFraction", is_valid)
         self.validate_inputs()
 
     def create_injector_section(self, parent):
@@ -768,233 +821,164 @@ class HybridRocketGUI:
         self.create_epsilon_field(fields_frame)
 
     def create_epsilon_field(self, parent):
-        row = tk.Frame(parent, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text="(ε) eps:", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-        entry.bind('<KeyRelease>', lambda e: self.validate_epsilon())
-
-        self.inputs["Nozzle_epsilon"] = entry
+        self._make_labeled_entry(parent, "(ε) eps:", "Nozzle_epsilon")
 
     def validate_epsilon(self):
         entry = self.inputs["Nozzle_epsilon"]
-        value = entry.get().strip()
+        value = entry.var.get().strip()
 
         is_valid = False
         if value:
             if value.lower() == "adapt":
                 is_valid = True
             else:
-                try:
-                    float_val = float(value)
-                    if float_val > 1:
-                        is_valid = True
-                except ValueError:
-                    pass
+                ok, float_val = _try_float(value)
+                is_valid = ok and float_val > 1
 
-        if is_valid:
-            entry.configure(highlightbackground='#00aa00', highlightcolor='#00aa00')
-        else:
-            entry.configure(highlightbackground='red', highlightcolor='red')
+        self._paint_entry(entry, '#00aa00' if is_valid else 'red')
 
+        self._set_validity("Nozzle_epsilon", is_valid)
         self.validate_inputs()
 
     def create_float_field(self, parent, section, var_name, display_name, min_value=None,
                            max_value=None, exclusive=False):
-        row = tk.Frame(parent, bg=self.bg_light)
-        row.pack(fill=tk.X, pady=5)
-
-        label = tk.Label(row, text=display_name + ":", font=('Arial', 11),
-                         bg=self.bg_light, fg='black', width=25, anchor='w')
-        label.pack(side=tk.LEFT, padx=(0, 10))
-
-        entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2,
-                         highlightthickness=2, highlightbackground=self.bg_light,
-                         highlightcolor=self.bg_light)
-        entry.pack(side=tk.LEFT)
-
+        entry = self._make_labeled_entry(parent, display_name + ":", f"{section}_{var_name}")
         entry.validation_params = {
             'min_value': min_value,
             'max_value': max_value,
             'exclusive': exclusive
         }
 
-        entry.bind('<KeyRelease>', lambda e: self.validate_single_input(entry))
-
-        self.inputs[f"{section}_{var_name}"] = entry
+    def _on_keyrelease(self, event):
+        entry = event.widget
+        if self.VALIDATE_ON_KEYSTROKE:
+            self._schedule_validate(entry)
+        elif getattr(entry, '_last_hl', None) == 'red':
+            # Drop the stale error border while typing; the commit revalidates
+            self._paint_entry(entry, self.bg_light)
+
+    def _on_entry_commit(self, event):
+        entry = event.widget
+        pending = getattr(entry, '_validate_after_id', None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._run_validate(entry)
+
+    def _schedule_validate(self, entry):
+        """Revalidate entry 120 ms after its last keystroke"""
+        if self._suppress_validation:
+            return
+        pending = getattr(entry, '_validate_after_id', None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        entry._validate_after_id = self.root.after(120, self._run_validate, entry)
+
+    def _run_validate(self, entry):
+        entry._validate_after_id = None
+        if entry.winfo_exists():
+            self._revalidate_entry(entry._field_key)
+
+    def _check_entry(self, entry, value):
+        """Return whether value is acceptable for a plain (string or ranged float) entry"""
+        if not value:
+            return False
+        if entry._is_string_field:
+            return True
+
+        ok, float_val = _try_float(value)
+        params = getattr(entry, 'validation_params', None)
+        if not ok or params is None:
+            return ok
+
+        min_value = params['min_value']
+        if min_value is not None:
+            if not (float_val > min_value if params['exclusive'] else float_val >= min_value):
+                return False
+
+        max_value = params['max_value']
+        if max_value is not None:
+            if not (float_val < max_value if params['exclusive'] else float_val <= max_value):
+                return False
+        return True
 
     def validate_single_input(self, entry):
         """Validate a single input field and change border color"""
-        value = entry.get().strip()
-        is_valid = False
-
-        if value:
-            # Check if it's a string field
-            field_key = None
-            for key, val in self.inputs.items():
-                if val == entry:
-                    field_key = key
-                    break
-
-            if field_key and ("CustomName" in field_key or "ExpandedFormula" in field_key):
-                is_valid = len(value) > 0
-            else:
-                # Numeric validation
-                try:
-                    float_val = float(value)
-                    is_valid = True
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val > params['min_value']
-                            else:
-                                is_valid = is_valid and float_val >= params['min_value']
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                is_valid = is_valid and float_val < params['max_value']
-                            else:
-                                is_valid = is_valid and float_val <= params['max_value']
-                except ValueError:
-                    is_valid = False
+        value = entry.var.get().strip()
+        is_valid = self._check_entry(entry, value)
 
         if is_valid:
-            entry.configure(highlightbackground='#00aa00', highlightcolor='#00aa00')
+            self._paint_entry(entry, '#00aa00')
         elif value:
-            entry.configure(highlightbackground='red', highlightcolor='red')
+            self._paint_entry(entry, 'red')
         else:
-            entry.configure(highlightbackground=self.bg_light, highlightcolor=self.bg_light)
+            self._paint_entry(entry, self.bg_light)
 
+        self._set_validity(entry._field_key, is_valid)
         self.validate_inputs()
 
-    def validate_inputs(self):
-        all_valid = True
-
-        # Check all text entries
-        for key, entry in self.inputs.items():
-            if isinstance(entry, str):  # Skip string stored values like CustomName
-                continue
-
-            value = entry.get().strip()
-            if not value:
-                all_valid = False
-                continue
-
-            # String field validation
-            if "CustomName" in key or "ExpandedFormula" in key:
-                if not value:
-                    all_valid = False
-            # Numeric field validation
-            else:
-                try:
-                    float_val = float(value)
-
-                    if hasattr(entry, 'validation_params'):
-                        params = entry.validation_params
-
-                        if params.get('min_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val > params['min_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val >= params['min_value']):
-                                    all_valid = False
-
-                        if params.get('max_value') is not None:
-                            if params.get('exclusive'):
-                                if not (float_val < params['max_value']):
-                                    all_valid = False
-                            else:
-                                if not (float_val <= params['max_value']):
-                                    all_valid = False
-                except ValueError:
-                    all_valid = False
-
-        # Check epsilon special case
-        if "Nozzle_epsilon" in self.inputs:
-            eps_value = self.inputs["Nozzle_epsilon"].get().strip()
-            if eps_value:
-                if eps_value.lower() != "adapt":
-                    try:
-                        if float(eps_value) <= 1:
-                            all_valid = False
-                    except ValueError:
-                        all_valid = False
-            else:
-                all_valid = False
+    def _set_dropdown(self, key, value):
+        """Set a dropdown's value and remember it for validation"""
+        self.dropdowns[key].set(value)
+        self._dropdown_values[key] = value
+
+    def _paint_entry(self, entry, color):
+        """Set the entry's border color, skipping the Tk call if it is unchanged"""
+        if color != getattr(entry, '_last_hl', None):
+            entry.configure(highlightbackground=color, highlightcolor=color)
+            entry._last_hl = color
+
+    def _register_entry(self, key, entry, is_valid=False):
+        """Store entry under key and tag it with the key for O(1) lookup on keystrokes"""
+        entry._field_key = key
+        entry._is_string_field = key in self._STRING_KEYS
+        self.inputs[key] = entry
+        self._set_validity(key, is_valid)
+
+    def _set_validity(self, key, is_valid):
+        """Record an entry's validity and keep the invalid count in step"""
+        was_valid = self._validity.get(key, True)
+        if was_valid != is_valid:
+            self._invalid_count += -1 if is_valid else 1
+        self._validity[key] = is_valid
+
+    def _revalidate_entry(self, key):
+        """Re-run the validator that owns the entry stored under key"""
+        if key == "Nozzle_epsilon":
+            self.validate_epsilon()
+        elif key == "Fuel & Oxidiser_Fuel_WeightFraction":
+            self.validate_fuel_weight_fraction()
+        else:
+            self.validate_single_input(self.inputs[key])
 
-        # Check fuel weight fraction
-        if "Fuel & Oxidiser_Fuel_WeightFraction" in self.inputs:
-            value = self.inputs["Fuel & Oxidiser_Fuel_WeightFraction"].get().strip()
-            if value:
-                try:
-                    fractions = [float(x.strip()) for x in value.split(',')]
-                    if not (all(f > 0 for f in fractions) and abs(sum(fractions) - 100) < 0.01):
-                        all_valid = False
-                except ValueError:
-                    all_valid = False
-            else:
-                all_valid = False
+    def validate_inputs(self):
+        # The main window can't change while the search popup holds the grab
+        if self.search_popup_active or self._suppress_validation:
+            return
 
-        # Check dropdowns
-        for key, combo in self.dropdowns.items():
-            if not combo.get():
-                all_valid = False
+        # Entries and dropdowns keep their own state up to date; nothing is read from Tk here
+        all_valid = self._invalid_count == 0 and all(self._dropdown_values.get(key) for key in self.dropdowns)
 
-        # Change button color
-        if all_valid:
-            self.style.configure("Rounded.TButton", background='#006400')
-        else:
-            self.style.configure("Rounded.TButton", background='#8b0000')
+        # Change button color, only when it actually flips
+        color = '#006400' if all_valid else '#8b0000'
+        if color != self._last_button_color:
+            self.style.configure("Rounded.TButton", background=color)
+            self._last_button_color = color
 
     def import_line_placeholder(self):
         messagebox.showinfo("Info", "Import line function in development")
 
     def validate_and_save(self):
-        config = {}
-        all_valid = True
-
-        # Validate text entries
-        for key, entry in self.inputs.items():
-            if isinstance(entry, str):  # Handle stored string values
-                config[key] = entry
-                continue
-
-            value = entry.get().strip()
-            if not value:
-                all_valid = False
-                break
-
-            if "CustomName" in key or "ExpandedFormula" in key:
-                config[key] = value
-            else:
-                try:
-                    config[key] = float(value)
-                except ValueError:
-                    if key == "Nozzle_epsilon" and value.lower() == "adapt":
-                        config[key] = value
-                    else:
-                        all_valid = False
-                        break
-
-        # Validate dropdowns
-        for key, combo in self.dropdowns.items():
-            value = combo.get()
-            if not value:
-                all_valid = False
-                break
-            config[key] = value
+        # Re-run every entry's validator so edits not yet committed are counted too
+        self._suppress_validation = True
+        try:
+            for key, entry in self.inputs.items():
+                if entry.winfo_exists():
+                    self._revalidate_entry(key)
+        finally:
+            self._suppress_validation = False
+        self.validate_inputs()
 
+        all_valid = self._invalid_count == 0 and all(self._dropdown_values.get(key) for key in self.dropdowns)
         if all_valid:
             messagebox.showinfo("Success", "Configuration validated! All fields are valid.")
         else:
@@ -1016,23 +1000,17 @@ class HybridRocketGUI:
             self._save_to_file(filename)
 
     def _save_to_file(self, filename):
-        config = {}
+        config = dict(self.stored_strings)
 
         # Save text entries
         for key, entry in self.inputs.items():
-            if isinstance(entry, str):
-                config[key] = entry
-                continue
-
-            value = entry.get().strip()
+            value = entry.var.get().strip()
             if value:
-                if "CustomName" in key or "ExpandedFormula" in key:
+                if key in self._STRING_KEYS:
                     config[key] = value
                 else:
-                    try:
-                        config[key] = float(value)
-                    except ValueError:
-                        config[key] = value
+                    ok, float_val = _try_float(value)
+                    config[key] = float_val if ok else value
 
         # Save dropdowns
         for key, combo in self.dropdowns.items():
@@ -1040,8 +1018,10 @@ class HybridRocketGUI:
             if value:
                 config[key] = value
 
-        with open(filename, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Encode in one go and hand the file a single write
+        data = _CONFIG_ENCODER.encode(config).encode("utf-8")
+        with open(filename, 'wb') as f:
+            f.write(data)
 
         messagebox.showinfo("Saved", f"Configuration saved to:\n{filename}")
 
@@ -1050,20 +1030,21 @@ class HybridRocketGUI:
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
+            # Hold back form-wide validation until everything is loaded
+            self._suppress_validation = True
             try:
-                with open(filename, 'r') as f:
-                    config = json.load(f)
+                with open(filename, 'rb') as f:
+                    config = json.loads(f.read())
 
                 # Load text entries
                 for key, value in config.items():
                     if key in self.inputs:
-                        if isinstance(self.inputs[key], str):
-                            self.inputs[key] = value
-                        else:
-                            self.inputs[key].delete(0, tk.END)
-                            self.inputs[key].insert(0, str(value))
+                        self.inputs[key].var.set(str(value))
+                        self._revalidate_entry(key)
+                    elif key in self._STRING_KEYS:
+                        self.stored_strings[key] = value
                     elif key in self.dropdowns:
-                        self.dropdowns[key].set(value)
+                        self._set_dropdown(key, value)
 
                 # Trigger changes
                 if "Fuel & Oxidiser_Oxidizer" in self.dropdowns:
@@ -1072,10 +1053,13 @@ class HybridRocketGUI:
                     self.on_fuel_change()
 
                 self.current_file = filename
+                self._suppress_validation = False
                 self.validate_inputs()
                 messagebox.showinfo("Loaded", f"Configuration loaded from:\n{filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Error loading configuration:\n{str(e)}")
+            finally:
+                self._suppress_validation = False
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import json
+import re
 import numpy as np
 import threading
+import queue
 import sys
 import os
 
@@ -13,8 +15,35 @@ except ImportError:
     print("Warning: Could not import optimization module")
     optimization = None
 
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+except ImportError:
+    Figure = None
+
+
+def _grid_range(start, stop, step):
+    """Evenly spaced points from start to stop inclusive, without np.arange's float step drift"""
+    num = max(int(round((stop - start) / step)) + 1, 1)
+    return np.linspace(start, stop, num)
+
+
+def _thrust_per_dt2(pc, CF):
+    """Thrust over squared throat diameter, F/Dt**2 = pc*CF*At/Dt**2, element-wise on grids or scalars"""
+    return pc * CF * (0.25 * np.pi)
+
+
+def _count_flags(flag_array):
+    """Tally every convergence flag value in a single pass over flag_array"""
+    # Flags are small integers >= -1, so shift by one and histogram them linearly
+    counts = np.bincount(flag_array.ravel().astype(np.intp) + 1)
+    return {int(flag) - 1: int(counts[flag]) for flag in np.flatnonzero(counts)}
+
 
 class HybridRocketGUI:
+    _STRING_KEYS = frozenset(('oxidizer_cp', 'oxidizer_cea', 'fuel_name', 'fuel_formula', 'eps'))
+    _NUMERIC_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
     def __init__(self, root):
         self.root = root
         self.root.title("Hybrid Rocket Model")
@@ -32,9 +61,13 @@ class HybridRocketGUI:
 
         # Variables
         self.inputs = {}
+        self._invalid = set()
+        self._cached_config = None
         self.current_page = 'configuration'
         self.optimization_results = None
         self.is_optimizing = False
+        self._pages = {}
+        self._log_queue = queue.Queue()
 
         # Create UI
         self.create_header()
@@ -45,7 +78,9 @@ class HybridRocketGUI:
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Show configuration page
-        self.show_configuration_page()
+        self.change_page('configuration')
+
+        self.root.after(100, self._drain_log)
 
     def create_header(self):
         header = tk.Frame(self.root, bg=self.bg_dark, height=60)
@@ -113,27 +148,39 @@ class HybridRocketGUI:
 
         self.current_page = page
 
-        # Clear content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Show appropriate page
-        if page == 'configuration':
-            self.show_configuration_page()
-        elif page == 'optimization':
-            self.show_optimization_page()
-        elif page == 'output':
-            self.show_output_page()
-
-    def show_configuration_page(self):
+        # Pages are built once and only hidden, so entries and the console survive
+        for frame in self._pages.values():
+            frame.pack_forget()
+
+        if page not in self._pages:
+            frame = tk.Frame(self.content_frame, bg=self.bg_dark)
+            if page == 'configuration':
+                self.show_configuration_page(frame)
+            elif page == 'optimization':
+                self.show_optimization_page(frame)
+            elif page == 'output':
+                self.show_output_page(frame)
+            self._pages[page] = frame
+
+        self._pages[page].pack(fill=tk.BOTH, expand=True)
+
+    def refresh_output_page(self):
+        """Drop the cached Output page so it is rebuilt from the latest results"""
+        frame = self._pages.pop('output', None)
+        if frame is not None:
+            frame.destroy()
+        if self.current_page == 'output':
+            self.change_page('output')
+
+    def show_configuration_page(self, parent):
         # Title
-        title = tk.Label(self.content_frame, text="Configuration",
+        title = tk.Label(parent, text="Configuration",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
         title.pack(pady=(0, 20))
 
         # Create scrollable frame
-        canvas = tk.Canvas(self.content_frame, bg=self.bg_dark)
-        scrollbar = tk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(parent, bg=self.bg_dark)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.bg_dark)
 
         scrollable_frame.bind(
@@ -188,7 +235,7 @@ class HybridRocketGUI:
         scrollbar.pack(side="right", fill="y")
 
         # Save button
-        button_frame = tk.Frame(self.content_frame, bg=self.bg_dark)
+        button_frame = tk.Frame(parent, bg=self.bg_dark)
         button_frame.pack(side=tk.BOTTOM, anchor='se', pady=20, padx=20)
 
         self.save_btn = tk.Button(button_frame, text="Validate Configuration",
@@ -223,37 +270,50 @@ class HybridRocketGUI:
                              bg=self.bg_light, fg='black', width=30, anchor='w')
             label.pack(side=tk.LEFT, padx=(0, 10))
 
-            entry = tk.Entry(row, font=('Arial', 11), width=30, relief=tk.SUNKEN, bd=2)
-            entry.insert(0, default_value)
+            # Any write to the entry (typing, paste, insert) drops the cached config
+            entry_var = tk.StringVar(value=default_value)
+            entry_var.trace_add('write', self._invalidate_config)
+            entry = tk.Entry(row, textvariable=entry_var, font=('Arial', 11), width=30,
+                             relief=tk.SUNKEN, bd=2)
+            entry.var = entry_var
             entry.pack(side=tk.LEFT)
-            entry.bind('<KeyRelease>', lambda e: self.validate_inputs())
+            entry.bind('<KeyRelease>', lambda e, k=key: self.validate_one(k))
 
             self.inputs[key] = entry
 
-    def validate_inputs(self):
-        all_valid = True
+    def _is_valid(self, key):
+        value = self.inputs[key].get().strip()
+        if not value:
+            return False
 
-        for key, entry in self.inputs.items():
-            value = entry.get().strip()
-            if not value:
-                all_valid = False
-                continue
+        # Skip validation for string fields
+        if key in self._STRING_KEYS:
+            return True
 
-            # Skip validation for string fields
-            if key in ['oxidizer_cp', 'oxidizer_cea', 'fuel_name', 'fuel_formula', 'eps']:
-                continue
-
-            try:
-                float(value)
-            except ValueError:
-                all_valid = False
+        return self._NUMERIC_RE.fullmatch(value) is not None
 
+    def _update_save_btn(self):
         if hasattr(self, 'save_btn'):
-            if all_valid and len(self.inputs) > 0:
+            if not self._invalid and len(self.inputs) > 0:
                 self.save_btn.configure(bg='#006400')
             else:
                 self.save_btn.configure(bg='#8b0000')
 
+    def validate_one(self, key):
+        """Revalidate only the entry that changed and refresh the save button"""
+        if self._is_valid(key):
+            self._invalid.discard(key)
+        else:
+            self._invalid.add(key)
+        self._update_save_btn()
+
+    def validate_inputs(self):
+        self._invalid = {key for key in self.inputs if not self._is_valid(key)}
+        self._update_save_btn()
+
+    def _invalidate_config(self, *args):
+        self._cached_config = None
+
     def validate_and_save(self):
         config = self.get_config_dict()
         if config:
@@ -262,7 +322,10 @@ class HybridRocketGUI:
             messagebox.showerror("Error", "Some fields are invalid.")
 
     def get_config_dict(self):
-        """Extract configuration from inputs"""
+        """Extract configuration from inputs, reusing the last one until an entry changes"""
+        if self._cached_config is not None:
+            return self._cached_config
+
         try:
             config = {}
             for key, entry in self.inputs.items():
@@ -271,28 +334,29 @@ class HybridRocketGUI:
                     return None
 
                 # String fields
-                if key in ['oxidizer_cp', 'oxidizer_cea', 'fuel_name', 'fuel_formula', 'eps']:
+                if key in self._STRING_KEYS:
                     config[key] = value
                 else:
                     config[key] = float(value)
 
+            self._cached_config = config
             return config
         except ValueError:
             return None
 
-    def show_optimization_page(self):
-        title = tk.Label(self.content_frame, text="Optimization",
+    def show_optimization_page(self, parent):
+        title = tk.Label(parent, text="Optimization",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
         title.pack(pady=(0, 20))
 
         # Instructions
-        info = tk.Label(self.content_frame,
+        info = tk.Label(parent,
                         text="Configure parameters in the Configuration page, then run optimization.",
                         font=('Arial', 12), bg=self.bg_dark, fg=self.text_color, wraplength=800)
         info.pack(pady=20)
 
         # Progress frame
-        progress_frame = tk.Frame(self.content_frame, bg=self.bg_medium, relief=tk.RIDGE, bd=2)
+        progress_frame = tk.Frame(parent, bg=self.bg_medium, relief=tk.RIDGE, bd=2)
         progress_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Progress label
@@ -315,7 +379,7 @@ class HybridRocketGUI:
         self.console_output.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
         # Run button
-        button_frame = tk.Frame(self.content_frame, bg=self.bg_dark)
+        button_frame = tk.Frame(parent, bg=self.bg_dark)
         button_frame.pack(side=tk.BOTTOM, pady=20)
 
         self.run_btn = tk.Button(button_frame, text="Run Optimization",
@@ -325,11 +389,23 @@ class HybridRocketGUI:
         self.run_btn.pack()
 
     def log_to_console(self, message):
-        """Add message to console output"""
-        if hasattr(self, 'console_output'):
-            self.console_output.insert(tk.END, message + "\n")
+        """Queue message for the console output, safe to call from the worker thread"""
+        self._log_queue.put(message)
+
+    def _drain_log(self):
+        """Flush all queued console messages in one insert on the main thread"""
+        messages = []
+        try:
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if messages and hasattr(self, 'console_output') and self.console_output.winfo_exists():
+            self.console_output.insert(tk.END, "\n".join(messages) + "\n")
             self.console_output.see(tk.END)
-            self.console_output.update()
+
+        self.root.after(100, self._drain_log)
 
     def run_optimization(self):
         """Run the optimization in a separate thread"""
@@ -365,15 +441,15 @@ class HybridRocketGUI:
             self.log_to_console(f"Configuration loaded: {len(self.inputs)} parameters")
 
             # Prepare parameters
-            Dport_Dt_range = np.arange(config['dport_dt_min'],
-                                       config['dport_dt_max'],
-                                       config['dport_dt_step'])
-            Dinj_Dt_range = np.arange(config['dinj_dt_min'],
-                                      config['dinj_dt_max'],
-                                      config['dinj_dt_step'])
-            Lc_Dt_range = np.arange(config['lc_dt_min'],
-                                    config['lc_dt_max'],
-                                    config['lc_dt_step'])
+            Dport_Dt_range = _grid_range(config['dport_dt_min'],
+                                         config['dport_dt_max'],
+                                         config['dport_dt_step'])
+            Dinj_Dt_range = _grid_range(config['dinj_dt_min'],
+                                        config['dinj_dt_max'],
+                                        config['dinj_dt_step'])
+            Lc_Dt_range = _grid_range(config['lc_dt_min'],
+                                      config['lc_dt_max'],
+                                      config['lc_dt_step'])
 
             self.log_to_console(f"Dport/Dt range: {len(Dport_Dt_range)} points")
             self.log_to_console(f"Dinj/Dt range: {len(Dinj_Dt_range)} points")
@@ -408,6 +484,12 @@ class HybridRocketGUI:
                 oxidizer, fuel, config['pamb'], config['gamma0']
             )
 
+            # Count convergence
+            flag_array = results.flag
+            flag_counts = _count_flags(flag_array)
+            converged = flag_counts.get(0, 0)
+            total = flag_array.size
+
             # Store results
             self.optimization_results = {
                 'arrays': results,
@@ -416,14 +498,10 @@ class HybridRocketGUI:
                     'Dinj_Dt': Dinj_Dt_range,
                     'Lc_Dt': Lc_Dt_range
                 },
-                'config': config
+                'config': config,
+                'flag_counts': flag_counts
             }
 
-            # Count convergence
-            flag_array = results[-1]
-            converged = np.sum(flag_array == 0)
-            total = flag_array.size
-
             self.log_to_console(f"Optimization complete!")
             self.log_to_console(f"Converged: {converged}/{total} ({100 * converged / total:.1f}%)")
             self.log_to_console("Results stored. View in Output page.")
@@ -443,22 +521,23 @@ class HybridRocketGUI:
         self.run_btn.configure(state='normal', bg='#006400')
         self.is_optimizing = False
         self.progress_label.configure(text="Optimization complete")
+        self.refresh_output_page()
 
-    def show_output_page(self):
-        title = tk.Label(self.content_frame, text="Output",
+    def show_output_page(self, parent):
+        title = tk.Label(parent, text="Output",
                          font=('Arial', 28, 'bold'), bg=self.bg_dark, fg=self.text_color)
         title.pack(pady=(0, 20))
 
         if self.optimization_results is None:
-            info = tk.Label(self.content_frame,
+            info = tk.Label(parent,
                             text="No results available. Run optimization first.",
                             font=('Arial', 14), bg=self.bg_dark, fg=self.text_color)
             info.pack(pady=50)
             return
 
         # Create scrollable frame for results
-        canvas = tk.Canvas(self.content_frame, bg=self.bg_dark)
-        scrollbar = tk.Scrollbar(self.content_frame, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(parent, bg=self.bg_dark)
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.bg_dark)
 
         scrollable_frame.bind(
@@ -471,7 +550,7 @@ class HybridRocketGUI:
 
         # Display results summary
         results = self.optimization_results['arrays']
-        flag_array = results[-1]
+        flag_array = results.flag
 
         summary_frame = tk.Frame(scrollable_frame, bg=self.bg_light, relief=tk.RIDGE, bd=2)
         summary_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -479,16 +558,17 @@ class HybridRocketGUI:
         tk.Label(summary_frame, text="Optimization Summary", font=('Arial', 16, 'bold'),
                  bg=self.bg_light).pack(pady=10)
 
-        converged = np.sum(flag_array == 0)
+        flag_counts = self.optimization_results['flag_counts']
+        converged = flag_counts.get(0, 0)
         total = flag_array.size
 
         summary_text = f"""
 Total configurations: {total}
 Converged: {converged} ({100 * converged / total:.1f}%)
-Pressure diverged: {np.sum(flag_array == 1)}
-CEA diverged: {np.sum(flag_array == -1)}
-Both diverged: {np.sum(flag_array == 2)}
-No solution: {np.sum(flag_array == 10)}
+Pressure diverged: {flag_counts.get(1, 0)}
+CEA diverged: {flag_counts.get(-1, 0)}
+Both diverged: {flag_counts.get(2, 0)}
+No solution: {flag_counts.get(10, 0)}
         """
 
         tk.Label(summary_frame, text=summary_text, font=('Arial', 12),
@@ -496,10 +576,14 @@ No solution: {np.sum(flag_array == 10)}
 
         # Best configuration (highest Is)
         if converged > 0:
-            Is_array = results[16]
-            mask = flag_array == 0
-            Is_converged = np.where(mask, Is_array, -np.inf)
-            best_idx = np.unravel_index(np.argmax(Is_converged), Is_converged.shape)
+            best_idx = self.optimization_results.get('best_idx')
+            if best_idx is None:
+                # Argmax over the converged cells only; ravel() gives views, not copies
+                Is_array = results.Is
+                converged_flat = np.flatnonzero(flag_array.ravel() == 0)
+                best_flat = converged_flat[np.argmax(Is_array.ravel()[converged_flat])]
+                best_idx = np.unravel_index(best_flat, Is_array.shape)
+                self.optimization_results['best_idx'] = best_idx
 
             best_frame = tk.Frame(scrollable_frame, bg=self.bg_light, relief=tk.RIDGE, bd=2)
             best_frame.pack(fill=tk.X, padx=20, pady=10)
@@ -517,25 +601,49 @@ Dport/Dt: {best_dport:.3f}
 Dinj/Dt: {best_dinj:.3f}
 Lc/Dt: {best_lc:.3f}
 
-Chamber Pressure: {results[0][best_idx]:.2f} Pa
-Specific Impulse: {results[16][best_idx]:.2f} s
-Mixture Ratio: {results[8][best_idx]:.3f}
-Chamber Temperature: {results[10][best_idx]:.2f} K
+Chamber Pressure: {results.pc[best_idx]:.2f} Pa
+Specific Impulse: {results.Is[best_idx]:.2f} s
+Mixture Ratio: {results.MR[best_idx]:.3f}
+Chamber Temperature: {results.Tc[best_idx]:.2f} K
+Thrust/Dt²: {_thrust_per_dt2(results.pc[best_idx], results.CF[best_idx]):.2f} N/m²
             """
 
             tk.Label(best_frame, text=best_text, font=('Arial', 12),
                      bg=self.bg_light, justify=tk.LEFT).pack(pady=10)
 
+            if Figure is not None:
+                self.create_is_map(scrollable_frame, results, ranges, best_idx)
+
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
         # Export button
-        export_btn = tk.Button(self.content_frame, text="Export Results",
+        export_btn = tk.Button(parent, text="Export Results",
                                font=('Arial', 12, 'bold'),
                                bg='#006400', fg='white', relief=tk.RAISED,
                                padx=20, pady=10, command=self.export_results)
         export_btn.pack(side=tk.BOTTOM, pady=20)
 
+    def create_is_map(self, parent, results, ranges, best_idx):
+        """Plot Is over Dport/Dt and Dinj/Dt at the best Lc/Dt as one image"""
+        # A single imshow bitmap instead of one canvas item per grid cell
+        Is_slice = np.where(results.flag[:, :, best_idx[2]] == 0, results.Is[:, :, best_idx[2]], np.nan)
+        Dport_range = ranges['Dport_Dt']
+        Dinj_range = ranges['Dinj_Dt']
+
+        fig = Figure(figsize=(6, 4), dpi=100)
+        ax = fig.add_subplot()
+        image = ax.imshow(Is_slice, origin='lower', aspect='auto',
+                          extent=(Dinj_range[0], Dinj_range[-1], Dport_range[0], Dport_range[-1]))
+        ax.set_xlabel("Dinj/Dt")
+        ax.set_ylabel("Dport/Dt")
+        ax.set_title(f"Is [s] at Lc/Dt = {ranges['Lc_Dt'][best_idx[2]]:.3f}")
+        fig.colorbar(image, ax=ax)
+
+        plot_frame = tk.Frame(parent, bg=self.bg_light, relief=tk.RIDGE, bd=2)
+        plot_frame.pack(fill=tk.X, padx=20, pady=10)
+        FigureCanvasTkAgg(fig, master=plot_frame).get_tk_widget().pack(pady=10)
+
     def export_results(self):
         """Export results to numpy file"""
         if self.optimization_results is None:
@@ -551,17 +659,15 @@ Chamber Temperature: {results[10][best_idx]:.2f} K
             results = self.optimization_results['arrays']
             ranges = self.optimization_results['ranges']
 
-            np.savez(filename,
-                     pc=results[0], Fpc=results[1], p_inj=results[2],
-                     mdot_ox=results[3], mdot_fuel=results[4], mdot=results[5],
-                     Gox=results[6], r=results[7], MR=results[8],
-                     eps=results[9], Tc=results[10], MW=results[11],
-                     gamma=results[12], cs=results[13], CF_vac=results[14],
-                     CF=results[15], Ivac=results[16], Is=results[17],
-                     flag=results[18],
-                     Dport_Dt_range=ranges['Dport_Dt'],
-                     Dinj_Dt_range=ranges['Dinj_Dt'],
-                     Lc_Dt_range=ranges['Lc_Dt'])
+            # Flags are small integers (-1..10), int8 keeps them exact at 1/8 the size
+            arrays = results._asdict()
+            arrays['flag'] = results.flag.astype(np.int8)
+            arrays['F'] = _thrust_per_dt2(results.pc, results.CF)
+
+            np.savez_compressed(filename, **arrays,
+                                Dport_Dt_range=ranges['Dport_Dt'],
+                                Dinj_Dt_range=ranges['Dinj_Dt'],
+                                Lc_Dt_range=ranges['Lc_Dt'])
 
             messagebox.showinfo("Success", f"Results exported to:\n{filename}")
 
@@ -4,9 +4,33 @@ at convergence for every parameter combination.
 """
 import numpy as np
 import time
+from typing import NamedTuple
 import Performance.performance_singlepoint as perfs
 
 
+class SimulationResults(NamedTuple):
+    """Named output grids of full_range_simulation, still unpackable as the old 19-tuple"""
+    pc: np.ndarray
+    Fpc: np.ndarray
+    p_inj: np.ndarray
+    mdot_ox: np.ndarray
+    mdot_fuel: np.ndarray
+    mdot: np.ndarray
+    Gox: np.ndarray
+    r: np.ndarray
+    MR: np.ndarray
+    eps: np.ndarray
+    Tc: np.ndarray
+    MW: np.ndarray
+    gamma: np.ndarray
+    cs: np.ndarray
+    CF_vac: np.ndarray
+    CF: np.ndarray
+    Ivac: np.ndarray
+    Is: np.ndarray
+    flag: np.ndarray
+
+
 def starting_pressure(Ainj, Aport, At, Ab, eps, ptank, Ttank, CD, a, n, rho_fuel, oxidizer, fuel,
                                   pamb=0.0, gamma0=1.3):
     """
@@ -199,7 +223,8 @@ def full_range_simulation(Dport_Dt_range, Dinj_Dt_range, Lc_Dt_range, eps, ptank
         "Specific Enthalpy [kj/mol]" : []
         }
     :param pamb: Ambient pressure [Pa]
-    :return: pc_array (Chamber pressure array) [Pa],
+    :return: SimulationResults with fields
+            pc_array (Chamber pressure array) [Pa],
             Fpc_array (Chamber pressure function array) [Pa],
             p_inj_array (Injection pressure array) [Pa],
             mdot_ox_array (Oxidizer mass flow corrected with squared throad diameter array) [kg/(s*m**2)],
@@ -250,15 +275,23 @@ def full_range_simulation(Dport_Dt_range, Dinj_Dt_range, Lc_Dt_range, eps, ptank
     flag_array      = 100*np.ones((Dport_length, Dinj_length, Lc_length)) # ones to be sure
 
 
+    # Calculate areas (A/Dt**2) once for the whole grid, the loop only indexes them
     Dt = 1
-    for ind_Dport, Dport in enumerate(Dport_Dt_range):
-        for ind_Dinj, Dinj in enumerate(Dinj_Dt_range):
-            for ind_Lc, Lc in enumerate(Lc_Dt_range):
-                # Calculate areas (A/Dt**2)
-                Aport = 0.25*np.pi*(Dport**2)
-                Ainj = 0.25*np.pi*(Dinj**2)
-                At = 0.25*np.pi*(Dt**2)
-                Ab = np.pi*Dport*Lc
+    At = 0.25*np.pi*(Dt**2)
+    # sparse=True keeps the (n,1) and (1,m) axes, broadcasting builds Ab without full index grids
+    Dport_grid, Dinj_grid, Lc_grid = np.meshgrid(Dport_Dt_range, Dinj_Dt_range, Lc_Dt_range,
+                                                 indexing='ij', sparse=True)
+    Aport_range = (0.25*np.pi*Dport_grid.ravel()**2).tolist()
+    Ainj_range = (0.25*np.pi*Dinj_grid.ravel()**2).tolist()
+    Ab_grid = (np.pi*Dport_grid[:, 0, :]*Lc_grid[:, 0, :]).tolist()
+
+    for ind_Dport in range(Dport_length):
+        Aport = Aport_range[ind_Dport]
+        Ab_row = Ab_grid[ind_Dport]
+        for ind_Dinj in range(Dinj_length):
+            Ainj = Ainj_range[ind_Dinj]
+            for ind_Lc in range(Lc_length):
+                Ab = Ab_row[ind_Lc]
                 pc, Fpc, n_iter, maxit, gamma0 = get_pressure(Ainj, Aport, At, Ab, eps, ptank, Ttank,
                                                       CD, a, n, rho_fuel, oxidizer, fuel, pamb, gamma0)
 
@@ -309,9 +342,9 @@ def full_range_simulation(Dport_Dt_range, Dinj_Dt_range, Lc_Dt_range, eps, ptank
                 else:
                     flag_array[ind_Dport, ind_Dinj, ind_Lc]     = 0
 
-    return (pc_array, Fpc_array, p_inj_array, mdot_ox_array, mdot_fuel_array, mdot_array, Gox_array,
-            r_array, MR_array, eps_array, Tc_array, MW_array, gamma_array, cs_array,
-            CF_vac_array, CF_array, Ivac_array, Is_array, flag_array)
+    return SimulationResults(pc_array, Fpc_array, p_inj_array, mdot_ox_array, mdot_fuel_array, mdot_array,
+                             Gox_array, r_array, MR_array, eps_array, Tc_array, MW_array, gamma_array,
+                             cs_array, CF_vac_array, CF_array, Ivac_array, Is_array, flag_array)
 
 
 if __name__=="__main__":